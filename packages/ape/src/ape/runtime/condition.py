@@ -0,0 +1,195 @@
+"""
+APE Condition Compilation
+
+Turns condition expressions used by the decision engines into plain
+Python closures, compiled once and called per evaluation.
+
+Author: David Van Aelst
+Status: Decision Engine v2024
+"""
+
+import ast
+import keyword
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Optional
+
+
+ConditionFn = Callable[[Dict[str, Any]], Any]
+
+# Nodes that introduce their own bindings; names inside them cannot be
+# rewritten to context lookups, so such conditions are not compiled.
+_SCOPED_NODES = (
+    ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp,
+    ast.GeneratorExp, ast.NamedExpr,
+)
+
+# Nodes that would turn the generated lambda into a generator, which is
+# always truthy where the eval fallback raises SyntaxError
+_GENERATOR_NODES = (ast.Yield, ast.YieldFrom)
+
+
+class _DictObject:
+    """
+    Read-only view of a context dict, as the eval fallback's DictWrapper.
+
+    Keys are reachable as attributes only (no subscripts, iteration or
+    `in`), nested dicts come back wrapped, and the view is always truthy
+    and equal only to a view of the same dict. Each read makes a new view,
+    so unlike DictWrapper `user is user` is False.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return _wrap(self._data[name])
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _DictObject) and other._data is self._data
+
+    def __hash__(self) -> int:
+        return id(self._data)
+
+
+def _wrap(value: Any) -> Any:
+    """Wrap dict values so they behave as under the eval fallback."""
+    return _DictObject(value) if isinstance(value, dict) else value
+
+
+class _ContextRewriter(ast.NodeTransformer):
+    """Rewrite free names to `_wrap(_ns[name])`; dot access stays getattr."""
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        lookup = ast.Subscript(
+            value=ast.Name(id="_ns", ctx=ast.Load()),
+            slice=ast.Constant(value=node.id),
+            ctx=ast.Load(),
+        )
+        return ast.copy_location(
+            ast.Call(func=ast.Name(id="_wrap", ctx=ast.Load()), args=[lookup], keywords=[]),
+            node,
+        )
+
+
+def compile_condition(condition: str, filename: str = "<condition>") -> Optional[ConditionFn]:
+    """
+    Compile a condition expression into a closure over a context dict.
+
+    The closure behaves like the engines' eval fallback: no builtins, and
+    nested dicts are reachable with dot notation. A dict used as a value
+    acts like the fallback's DictWrapper (always truthy, equal only to
+    itself, not subscriptable). Names are resolved with a local subscript
+    instead of eval's namespace lookups. Unknown names raise KeyError, so
+    callers that treat errors as "no match" keep doing so.
+
+    Args:
+        condition: Expression source, e.g. "user.verified == True"
+        filename: Name reported in tracebacks
+
+    Returns:
+        Callable taking the context dict, or None if the expression is
+        invalid or uses constructs with their own scope (comprehensions,
+        lambdas, assignment expressions) or that only compile outside a
+        function (await, yield)
+    """
+    try:
+        tree = ast.parse(condition, mode="eval")
+    except SyntaxError:
+        return None
+
+    if any(isinstance(node, _SCOPED_NODES + _GENERATOR_NODES) for node in ast.walk(tree)):
+        return None
+
+    body = _ContextRewriter().visit(tree.body)
+    func = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[], args=[ast.arg(arg="_ns")], vararg=None,
+                kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[],
+            ),
+            body=body,
+        )
+    )
+    ast.fix_missing_locations(func)
+
+    try:
+        code = compile(func, filename, "eval")
+    except SyntaxError:
+        # Parses but is rejected in a function body, e.g. "await x"
+        return None
+    return eval(code, {"__builtins__": {}, "_wrap": _wrap})
+
+
+def _unconditional_names(node: ast.AST) -> Iterator[str]:
+    """Names read on every evaluation path through `node`."""
+    if isinstance(node, ast.Name):
+        yield node.id
+        return
+    if isinstance(node, ast.BoolOp):
+        children = node.values[:1]
+    elif isinstance(node, ast.IfExp):
+        children = [node.test]
+    elif isinstance(node, ast.Compare):
+        children = [node.left, node.comparators[0]]
+    else:
+        children = ast.iter_child_nodes(node)
+    for child in children:
+        yield from _unconditional_names(child)
+
+
+def free_names(condition: str) -> FrozenSet[str]:
+    """
+    Top-level names a condition reads on every evaluation path.
+
+    Evaluating the condition in a context missing any of these names can
+    only fail, so `free_names(c) <= context.keys()` is a cheap pre-check.
+    Operands that `and`/`or`, conditional expressions and chained
+    comparisons may skip are left out. Empty (the pre-check always passes)
+    when the expression does not parse or binds names itself
+    (comprehensions, lambdas, assignment expressions).
+    """
+    try:
+        tree = ast.parse(condition, mode="eval")
+    except SyntaxError:
+        return frozenset()
+
+    if any(isinstance(node, _SCOPED_NODES) for node in ast.walk(tree)):
+        return frozenset()
+    return frozenset(_unconditional_names(tree))
+
+
+def compile_path(path: str, filename: str = "<path>") -> Optional[ConditionFn]:
+    """
+    Compile a plain dotted path into a straight-line getter.
+
+    Same lookups as compile_condition(path) (dict keys for dicts,
+    attributes otherwise), generated as one statement per segment so a
+    read costs no helper calls.
+
+    Args:
+        path: Dotted name, e.g. "customer.age"
+        filename: Name reported in tracebacks
+
+    Returns:
+        Callable taking the context dict, or None if path is not a
+        dotted sequence of identifiers
+    """
+    parts = path.strip().split(".")
+    if not all(part.isidentifier() and not keyword.iskeyword(part) for part in parts):
+        return None
+
+    lines = ["def _get(_ns):", f"    v = _ns[{parts[0]!r}]"]
+    for part in parts[1:]:
+        lines.append(f"    v = v[{part!r}] if isinstance(v, dict) else getattr(v, {part!r})")
+    lines.append("    return v")
+
+    namespace = {"__builtins__": {}, "isinstance": isinstance, "dict": dict, "getattr": getattr}
+    exec(compile("\n".join(lines), filename, "exec"), namespace)
+    return namespace["_get"]
+
+
+__all__ = ['compile_condition', 'compile_path', 'free_names', 'ConditionFn']
@@ -7,11 +7,20 @@ Author: David Van Aelst
 Status: Decision Engine v2024 - Complete
 """
 
-from typing import Any, Dict, List, Optional, Callable, Set
+import ast
+import hashlib
+from types import CodeType
+from typing import Any, Dict, FrozenSet, Hashable, List, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import time
 
+from ape.runtime.condition import free_names
+
+
+# Input value types the determinism cache keys without serializing
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 class ConstraintType(Enum):
     """Types of constraints"""
@@ -32,6 +41,22 @@ class Constraint:
     severity: str = "error"  # "error", "warning", "info"
     enabled: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
+    compiled: Optional[CodeType] = field(default=None, init=False, repr=False, compare=False)
+    required_names: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Compile once so validation does not re-parse the condition
+        try:
+            tree = ast.parse(self.condition, mode="eval")
+        except SyntaxError:
+            return  # Left uncompiled: evaluates to a violation, as before
+
+        nodes = list(ast.walk(tree))
+        if any(isinstance(node, ast.NamedExpr) for node in nodes):
+            return  # Would assign into the caller's context; keep the copying eval path
+
+        self.compiled = compile(tree, f"<constraint:{self.name}>", "eval")
+        self.required_names = free_names(self.condition)
 
 
 @dataclass
@@ -110,8 +135,8 @@ class ConstraintChecker:
         self.enabled = True
         self.strict_mode = True  # Raise on errors vs collect violations
         
-        # Determinism tracking
-        self._execution_cache: Dict[str, Any] = {}
+        # Determinism tracking, keyed by (function name, input key)
+        self._execution_cache: Dict[Tuple[str, Hashable], Any] = {}
     
     def add_constraint(self, name: str, type: ConstraintType, condition: str,
                       error_message: str = "", severity: str = "error") -> None:
@@ -144,13 +169,15 @@ class ConstraintChecker:
         return False
     
     def validate_preconditions(self, context: Dict[str, Any],
-                               executor: Optional[Any] = None) -> ValidationResult:
+                               executor: Optional[Any] = None,
+                               fail_fast: bool = False) -> ValidationResult:
         """
         Validate preconditions before execution.
         
         Args:
             context: Input variables
             executor: RuntimeExecutor instance
+            fail_fast: Stop at the first error-severity violation
         
         Returns:
             ValidationResult with any violations
@@ -158,17 +185,20 @@ class ConstraintChecker:
         return self._validate_constraints(
             ConstraintType.PRECONDITION,
             context,
-            executor
+            executor,
+            fail_fast=fail_fast
         )
     
     def validate_postconditions(self, context: Dict[str, Any],
-                                executor: Optional[Any] = None) -> ValidationResult:
+                                executor: Optional[Any] = None,
+                                fail_fast: bool = False) -> ValidationResult:
         """
         Validate postconditions after execution.
         
         Args:
             context: Output variables
             executor: RuntimeExecutor instance
+            fail_fast: Stop at the first error-severity violation
         
         Returns:
             ValidationResult with any violations
@@ -176,17 +206,20 @@ class ConstraintChecker:
         return self._validate_constraints(
             ConstraintType.POSTCONDITION,
             context,
-            executor
+            executor,
+            fail_fast=fail_fast
         )
     
     def validate_invariants(self, context: Dict[str, Any],
-                           executor: Optional[Any] = None) -> ValidationResult:
+                           executor: Optional[Any] = None,
+                           fail_fast: bool = False) -> ValidationResult:
         """
         Validate invariants (can be checked at any time).
         
         Args:
             context: Current state
             executor: RuntimeExecutor instance
+            fail_fast: Stop at the first error-severity violation
         
         Returns:
             ValidationResult with any violations
@@ -194,7 +227,8 @@ class ConstraintChecker:
         return self._validate_constraints(
             ConstraintType.INVARIANT,
             context,
-            executor
+            executor,
+            fail_fast=fail_fast
         )
     
     def check_determinism(self, inputs: Dict[str, Any], outputs: Any,
@@ -214,7 +248,7 @@ class ConstraintChecker:
         violations = []
         
         # Create cache key from inputs
-        cache_key = f"{function_name}:{self._hash_inputs(inputs)}"
+        cache_key = self._cache_key(function_name, inputs)
         
         if cache_key in self._execution_cache:
             # Check if outputs match
@@ -300,7 +334,8 @@ class ConstraintChecker:
     
     def _validate_constraints(self, constraint_type: ConstraintType,
                              context: Dict[str, Any],
-                             executor: Optional[Any]) -> ValidationResult:
+                             executor: Optional[Any],
+                             fail_fast: bool = False) -> ValidationResult:
         """Internal: validate constraints of a specific type"""
         if not self.enabled:
             return ValidationResult(
@@ -314,16 +349,24 @@ class ConstraintChecker:
         violations = []
         warnings = []
         
+        # Constraints sharing a condition (e.g. the same bound at error and
+        # warning severity) are evaluated once against this context
+        outcomes: Dict[str, bool] = {}
+        
         for constraint in self.constraints[constraint_type]:
             if not constraint.enabled:
                 continue
             
             # Evaluate constraint condition
-            satisfied = self._evaluate_constraint(
-                constraint.condition,
-                context,
-                executor
-            )
+            satisfied = outcomes.get(constraint.condition)
+            if satisfied is None:
+                satisfied = outcomes[constraint.condition] = self._evaluate_constraint(
+                    constraint.condition,
+                    context,
+                    executor,
+                    compiled=constraint.compiled,
+                    required_names=constraint.required_names
+                )
             
             if not satisfied:
                 violation = ConstraintViolation(
@@ -336,6 +379,9 @@ class ConstraintChecker:
                 
                 if constraint.severity == "error":
                     violations.append(violation)
+                    # Outcome is decided: the result can no longer pass
+                    if fail_fast:
+                        break
                 elif constraint.severity == "warning":
                     warnings.append(violation)
         
@@ -349,9 +395,19 @@ class ConstraintChecker:
         )
     
     def _evaluate_constraint(self, condition: str, context: Dict[str, Any],
-                            executor: Optional[Any]) -> bool:
+                            executor: Optional[Any],
+                            compiled: Optional[CodeType] = None,
+                            required_names: FrozenSet[str] = frozenset()) -> bool:
         """Evaluate a constraint condition"""
-        if executor is None:
+        if executor is None and compiled is not None:
+            # A missing variable can only raise NameError: not satisfied
+            if not required_names <= context.keys():
+                return False
+            try:
+                return bool(eval(compiled, {"__builtins__": {}}, context))
+            except Exception:
+                return False
+        elif executor is None:
             # Fallback: Python eval
             try:
                 namespace = dict(context)
@@ -367,6 +423,26 @@ class ConstraintChecker:
             except Exception:
                 return False
     
+    def _cache_key(self, function_name: str, inputs: Dict[str, Any]) -> Tuple[str, Hashable]:
+        """
+        Fixed-size determinism cache key for a call.
+
+        Scalar-only inputs are keyed by their sorted (name, type, value)
+        items. Including the type keeps 1, 1.0 and True apart, as the
+        canonical JSON form does. Anything else is keyed by a 16-byte
+        BLAKE2b digest of the canonical form, so stored keys do not grow
+        with the inputs.
+        """
+        try:
+            if all(type(v) in _SCALAR_TYPES for v in inputs.values()):
+                return (function_name, tuple(sorted(
+                    (k, type(v).__name__, v) for k, v in inputs.items()
+                )))
+        except TypeError:
+            pass  # Unorderable keys: use the canonical form
+        digest = hashlib.blake2b(self._hash_inputs(inputs).encode(), digest_size=16).digest()
+        return (function_name, digest)
+
     def _hash_inputs(self, inputs: Dict[str, Any]) -> str:
         """Create a hashable representation of inputs"""
         import json
@@ -7,10 +7,137 @@ Author: David Van Aelst
 Status: Decision Engine v2024 - Complete
 """
 
-from typing import Any, Dict, List, Optional, Set
+import ast
+import bisect
+import math
+import operator
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ape.runtime.condition import ConditionFn, compile_condition, compile_path
+
+
+CellMatcher = Callable[[Any], bool]
+
+# Checked in order, so two-character operators win over their prefixes
+_COMPARISONS = (
+    (">=", operator.ge), ("<=", operator.le), (">", operator.gt),
+    ("<", operator.lt), ("==", operator.eq), ("!=", operator.ne),
+)
+
+
+def _match_any(value: Any) -> bool:
+    return True
+
+
+# Marks text that is not a Python literal
+_NOT_LITERAL = object()
+
+
+def _literal(text: str) -> Any:
+    """The Python literal spelled by text, or _NOT_LITERAL"""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return _NOT_LITERAL
+
+
+def _compile_comparison(condition: str, threshold: str,
+                        compare: Callable[[Any, Any], Any]) -> CellMatcher:
+    """
+    Matcher for "<op> threshold" cells.
+
+    Compares numerically when both sides convert to float. Otherwise both
+    sides are read as Python literals, as the interpolated eval used to
+    do: "== None" matches None and "!= 5" matches a list, while text that
+    is not a literal (a bare word such as gold, or inf and nan) never
+    compares.
+    """
+    try:
+        threshold_num: Optional[float] = float(threshold)
+    except ValueError:
+        threshold_num = None
+    else:
+        if not math.isfinite(threshold_num):
+            return lambda value: condition == value
+    threshold_lit = _literal(threshold)
+
+    def matches(value: Any) -> bool:
+        if condition == value:
+            return True
+        if threshold_num is not None:
+            try:
+                number = float(value)
+            except (ValueError, TypeError):
+                pass
+            except OverflowError:
+                return False
+            else:
+                return math.isfinite(number) and compare(number, threshold_num)
+        if threshold_lit is _NOT_LITERAL:
+            return False
+        operand = value if value is None or isinstance(value, (bool, int)) else _literal(str(value))
+        if operand is _NOT_LITERAL:
+            return False
+        try:
+            return bool(compare(operand, threshold_lit))
+        except TypeError:
+            return False
+
+    return matches
+
+
+def _compile_range(condition: str) -> CellMatcher:
+    """Matcher for inclusive "low..high" cells"""
+    parts = condition.split("..")
+    try:
+        low = float(parts[0])
+        high = float(parts[1])
+    except ValueError:
+        return lambda value: condition == value
+
+    def matches(value: Any) -> bool:
+        if condition == value:
+            return True
+        try:
+            return low <= float(value) <= high
+        except (ValueError, TypeError, OverflowError):
+            return False
+
+    return matches
+
+
+def _compile_cell(condition: Any) -> CellMatcher:
+    """
+    Compile a decision-table cell into a matcher over the input value.
+
+    Cell syntax is parsed once here rather than on every evaluation.
+    Supports:
+    - Wildcard: "*", "-" or None matches anything
+    - Comparison: ">= 18" evaluates against value
+    - Range: "18..65" checks if value in range
+    - List: "[A,B,C]" checks if value in list
+    - Anything else: exact match
+    """
+    if condition in ("*", "-", None):
+        return _match_any
+
+    if isinstance(condition, str):
+        for op, compare in _COMPARISONS:
+            if condition.startswith(op):
+                return _compile_comparison(condition, condition[len(op):].strip(), compare)
+
+        if ".." in condition:
+            return _compile_range(condition)
+
+        if condition.startswith("[") and condition.endswith("]"):
+            items = tuple(item.strip() for item in condition[1:-1].split(","))
+            return lambda value: condition == value or value in items
+
+    return lambda value: condition == value
+
 
 class HitPolicy(Enum):
     """Decision table hit policies (DMN-compatible)"""
@@ -29,6 +156,15 @@ class DecisionTableColumn:
     type: str  # "input" or "output"
     expression: Optional[str] = None  # For input columns
     default_value: Any = None  # For output columns
+    extractor: Optional[ConditionFn] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Compile the input expression once instead of eval-ing it per evaluation;
+        # plain dotted paths get a specialized getter
+        if self.expression:
+            filename = f"<column:{self.name}>"
+            self.extractor = (compile_path(self.expression, filename)
+                              or compile_condition(self.expression, filename))
 
 
 @dataclass
@@ -39,6 +175,25 @@ class DecisionTableRow:
     outputs: List[Any]  # Output values (one per output column)
     priority: int = 0
     annotation: str = ""  # Human-readable description
+    matchers: List[CellMatcher] = field(default_factory=list, init=False, repr=False, compare=False)
+    checks: Tuple[Tuple[int, CellMatcher], ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Intern string cells: repeated literals across rows share one object,
+        # and equality against interned values (source literals, rule outputs)
+        # resolves on identity
+        self.inputs = [
+            sys.intern(condition) if type(condition) is str else condition
+            for condition in self.inputs
+        ]
+        # One compiled matcher per input cell
+        self.matchers = [_compile_cell(condition) for condition in self.inputs]
+        # (column, matcher) for the cells that constrain anything; wildcard
+        # cells are dropped so matching never visits them
+        self.checks = tuple(
+            (i, matches) for i, matches in enumerate(self.matchers)
+            if matches is not _match_any
+        )
 
 
 @dataclass
@@ -81,13 +236,23 @@ class DecisionTable:
         # result.outputs = {"approved": True, "rate": 0.05}
     """
 
+    # Largest perfect-hash index (product of column domain sizes) worth building
+    SLOT_INDEX_LIMIT = 4096
+
     def __init__(self, name: str, hit_policy: HitPolicy = HitPolicy.FIRST):
         self.name = name
         self.hit_policy = hit_policy
         self.input_columns: List[DecisionTableColumn] = []
         self.output_columns: List[DecisionTableColumn] = []
+        # Output names and default template, kept in step with output_columns
+        self._output_names: List[str] = []
+        self._default_outputs: Dict[str, Any] = {}
         self.rows: List[DecisionTableRow] = []
         self.enabled = True
+        # Row indexes, built lazily on first evaluate (see _build_indexes)
+        self._slot_index: Optional[Tuple[List[Dict[Any, int]], List[int], List[Tuple[DecisionTableRow, ...]]]] = None
+        self._threshold_index: Optional[Tuple[int, List[float], List[Tuple[DecisionTableRow, ...]]]] = None
+        self._indexes_built = False
 
     def add_input_column(self, name: str, expression: str) -> None:
         """
@@ -118,6 +283,8 @@ class DecisionTable:
             default_value=default_value
         )
         self.output_columns.append(col)
+        self._output_names.append(name)
+        self._default_outputs[name] = default_value
 
     def add_row(self, inputs: List[Any], outputs: List[Any],
                 priority: int = 0, annotation: str = "") -> None:
@@ -148,6 +315,7 @@ class DecisionTable:
             annotation=annotation
         )
         self.rows.append(row)
+        self._invalidate_indexes()
 
         # Sort by priority if using PRIORITY hit policy
         if self.hit_policy == HitPolicy.PRIORITY:
@@ -175,14 +343,7 @@ class DecisionTable:
         input_values = self._extract_inputs(context, executor)
 
         # Find matching rows
-        matched_rows = []
-        for row in self.rows:
-            if self._row_matches(row, input_values, context, executor):
-                matched_rows.append(row)
-
-                # Stop at first match for FIRST or UNIQUE policies
-                if self.hit_policy in (HitPolicy.FIRST, HitPolicy.UNIQUE):
-                    break
+        matched_rows = self._match_rows(input_values, context, executor)
 
         # No matches = return defaults
         if not matched_rows:
@@ -191,6 +352,251 @@ class DecisionTable:
         # Apply hit policy to determine final outputs
         return self._apply_hit_policy(matched_rows, context)
 
+    def evaluate_batch(self, records: List[Dict[str, Any]],
+                       executor: Optional[Any] = None) -> List[DecisionTableResult]:
+        """
+        Evaluate decision table against many contexts.
+
+        Equivalent to calling evaluate() per record. The perfect-hash index
+        (when the table qualifies) is built once up front, and row matching
+        runs once per distinct combination of input values in the batch;
+        records repeating a combination reuse the matched rows.
+
+        Args:
+            records: Input contexts, one per decision
+            executor: RuntimeExecutor instance
+
+        Returns:
+            One DecisionTableResult per record, in order
+        """
+        if not self.enabled or not self.rows:
+            return [self.evaluate(record, executor) for record in records]
+
+        if not self._indexes_built:
+            self._build_indexes()
+
+        results = []
+        seen: Dict[Tuple[Any, ...], Any] = {}
+        for record in records:
+            input_values = self._extract_inputs(record, executor)
+            try:
+                key: Optional[Tuple[Any, ...]] = tuple(input_values)
+                matched_rows = seen.get(key)
+            except TypeError:
+                key = None  # Unhashable input value: match without memoizing
+                matched_rows = None
+            if matched_rows is None:
+                matched_rows = self._match_rows(input_values, record, executor)
+                if key is not None:
+                    seen[key] = matched_rows
+
+            if matched_rows:
+                results.append(self._apply_hit_policy(matched_rows, record))
+            else:
+                results.append(self._default_result("No rules matched"))
+        return results
+
+    def _match_rows(self, input_values: List[Any], context: Dict[str, Any],
+                    executor: Optional[Any]) -> Sequence[DecisionTableRow]:
+        """Rows matching the input values, honoring first-match hit policies"""
+        stop_at_first = self.hit_policy in (HitPolicy.FIRST, HitPolicy.UNIQUE)
+        matched_rows = self._lookup_rows(input_values)
+        if matched_rows is not None:
+            return matched_rows[:1] if stop_at_first else matched_rows
+
+        matched = []
+        for row in self.rows:
+            if self._row_matches(row, input_values, context, executor):
+                matched.append(row)
+
+                # Stop at first match for FIRST or UNIQUE policies
+                if stop_at_first:
+                    break
+        return matched
+
+    def _invalidate_indexes(self) -> None:
+        """Drop the row indexes after the rows change"""
+        self._slot_index = None
+        self._threshold_index = None
+        self._indexes_built = False
+
+    def _build_indexes(self) -> None:
+        """Build whichever row index applies to the current rows"""
+        self._indexes_built = True
+        self._build_slot_index()
+        if self._slot_index is None:
+            self._build_threshold_index()
+
+    def _build_slot_index(self) -> None:
+        """
+        Build a perfect-hash index over the input column domains.
+
+        Only applies when every input cell is a wildcard or a hashable
+        literal (no comparison, range or list conditions). Each column's
+        literals get codes 0..c-1, and code c stands for "any other value".
+        A slot is the mixed-radix number of the column codes. Each slot
+        stores, in table order, the rows that match that combination.
+        The index is skipped when the slot count exceeds SLOT_INDEX_LIMIT.
+        """
+        self._slot_index = None
+
+        domains: List[Dict[Any, int]] = [{} for _ in self.input_columns]
+        for row in self.rows:
+            for domain, condition in zip(domains, row.inputs):
+                if condition in ("*", "-", None):
+                    continue
+                if not self._is_literal_condition(condition):
+                    return
+                domain.setdefault(condition, len(domain))
+
+        strides = []
+        total = 1
+        for domain in domains:
+            strides.append(total)
+            total *= len(domain) + 1
+            if total > self.SLOT_INDEX_LIMIT:
+                return
+
+        slots: List[List[DecisionTableRow]] = [[] for _ in range(total)]
+        for row in self.rows:
+            # Slot numbers this row matches, expanded column by column
+            row_slots = [0]
+            for domain, stride, condition in zip(domains, strides, row.inputs):
+                if condition in ("*", "-", None):
+                    codes = range(len(domain) + 1)
+                else:
+                    codes = (domain[condition],)
+                row_slots = [base + code * stride for base in row_slots for code in codes]
+            for slot in row_slots:
+                slots[slot].append(row)
+
+        self._slot_index = (domains, strides, [tuple(rows) for rows in slots])
+
+    def _build_threshold_index(self) -> None:
+        """
+        Build a sorted breakpoint index for single-column numeric tables.
+
+        Applies when every non-wildcard cell sits in one input column and is
+        a numeric comparison or range. The sorted breakpoints split the
+        number line into regions (the open intervals between breakpoints and
+        the breakpoints themselves); every row matches a whole region or
+        none of it. Each region stores its matching rows in table order, so
+        a lookup is one bisect instead of a scan over all rows.
+        The index is skipped when the region count exceeds SLOT_INDEX_LIMIT.
+        """
+        self._threshold_index = None
+
+        column = None
+        points: Set[float] = set()
+        for row in self.rows:
+            for i, _ in row.checks:
+                if column is None:
+                    column = i
+                elif column != i:
+                    return
+                breakpoints = self._numeric_breakpoints(row.inputs[i])
+                if breakpoints is None:
+                    return
+                points.update(breakpoints)
+        if column is None or 2 * len(points) + 1 > self.SLOT_INDEX_LIMIT:
+            return
+
+        breaks = sorted(points)
+        # Region 2k is the open interval below breaks[k], region 2k+1 is
+        # breaks[k] itself, and the last region lies above every breakpoint
+        samples = [math.nextafter(breaks[0], -math.inf)]
+        for k, point in enumerate(breaks):
+            samples.append(point)
+            if k + 1 < len(breaks):
+                samples.append(point / 2 + breaks[k + 1] / 2)
+        samples.append(math.nextafter(breaks[-1], math.inf))
+
+        values: List[Any] = [None] * len(self.input_columns)
+        regions = []
+        for sample in samples:
+            values[column] = sample
+            regions.append(tuple(row for row in self.rows
+                                 if self._row_matches(row, values, {}, None)))
+
+        self._threshold_index = (column, breaks, regions)
+
+    @staticmethod
+    def _numeric_breakpoints(condition: Any) -> Optional[List[float]]:
+        """Numeric thresholds of a comparison or range cell, or None"""
+        if condition in ("*", "-", None):
+            return []
+        if not isinstance(condition, str):
+            return None
+        for op, _ in _COMPARISONS:
+            if condition.startswith(op):
+                try:
+                    point = float(condition[len(op):].strip())
+                except ValueError:
+                    return None
+                return [point] if math.isfinite(point) else None
+        if ".." in condition:
+            parts = condition.split("..")
+            try:
+                points = [float(parts[0]), float(parts[1])]
+            except ValueError:
+                return None
+            return points if all(map(math.isfinite, points)) else None
+        return None
+
+    @staticmethod
+    def _is_literal_condition(condition: Any) -> bool:
+        """True if the condition only ever matches by equality"""
+        if isinstance(condition, str):
+            if condition.startswith((">=", "<=", ">", "<", "==", "!=")):
+                return False
+            if ".." in condition:
+                return False
+            if condition.startswith("[") and condition.endswith("]"):
+                return False
+        try:
+            hash(condition)
+        except TypeError:
+            return False
+        return True
+
+    def _lookup_rows(self, input_values: List[Any]) -> Optional[Tuple[DecisionTableRow, ...]]:
+        """Matching rows via a row index, or None to fall back to a scan"""
+        if not self._indexes_built:
+            self._build_indexes()
+        if self._threshold_index is not None:
+            return self._lookup_threshold(input_values)
+        if self._slot_index is None:
+            return None
+
+        domains, strides, slots = self._slot_index
+        slot = 0
+        try:
+            for domain, stride, value in zip(domains, strides, input_values):
+                slot += domain.get(value, len(domain)) * stride
+        except TypeError:
+            # Unhashable input value: only the equality scan can handle it
+            return None
+        return slots[slot]
+
+    def _lookup_threshold(self, input_values: List[Any]) -> Optional[Tuple[DecisionTableRow, ...]]:
+        """Matching rows via the breakpoint index, or None to fall back to a scan"""
+        column, breaks, regions = self._threshold_index
+        value = input_values[column]
+        # Strings, bools and other types keep the scan's coercion rules
+        if type(value) not in (int, float):
+            return None
+        try:
+            value = float(value)
+        except OverflowError:
+            return None
+        if not math.isfinite(value):
+            return None
+
+        k = bisect.bisect_left(breaks, value)
+        if k < len(breaks) and breaks[k] == value:
+            return regions[2 * k + 1]
+        return regions[2 * k]
+
     def _extract_inputs(self, context: Dict[str, Any],
                        executor: Optional[Any]) -> List[Any]:
         """Extract input values from context using column expressions"""
@@ -201,7 +607,12 @@ class DecisionTable:
                 values.append(None)
                 continue
 
-            if executor is None:
+            if executor is None and col.extractor is not None:
+                try:
+                    values.append(col.extractor(context))
+                except Exception:
+                    values.append(None)
+            elif executor is None:
                 # Fallback: convert dicts to objects for dot notation support
                 try:
                     class DictWrapper:
@@ -253,8 +664,8 @@ class DecisionTable:
     def _row_matches(self, row: DecisionTableRow, input_values: List[Any],
                     context: Dict[str, Any], executor: Optional[Any]) -> bool:
         """Check if a row matches the input values"""
-        for i, (condition, value) in enumerate(zip(row.inputs, input_values)):
-            if not self._condition_matches(condition, value, context, executor):
+        for i, matches in row.checks:
+            if not matches(input_values[i]):
                 return False
         return True
 
@@ -270,56 +681,7 @@ class DecisionTable:
         - Range: "18..65" checks if value in range
         - List: "[A,B,C]" checks if value in list
         """
-        # Wildcard always matches
-        if condition in ("*", "-", None):
-            return True
-
-        # Exact match
-        if condition == value:
-            return True
-
-        # String-based conditions
-        if isinstance(condition, str):
-            # Comparison operators
-            for op in [">=", "<=", ">", "<", "==", "!="]:
-                if condition.startswith(op):
-                    try:
-                        threshold = condition[len(op):].strip()
-                        # Try to convert to number
-                        try:
-                            threshold_num = float(threshold)
-                            value_num = float(value)
-                        except (ValueError, TypeError):
-                            threshold_num = threshold
-                            value_num = value
-
-                        # Evaluate comparison
-                        expr = f"{value_num} {op} {threshold_num}"
-                        result = eval(expr, {"__builtins__": {}}, {})
-                        return bool(result)
-                    except Exception:
-                        return False
-
-            # Range: "18..65"
-            if ".." in condition:
-                try:
-                    parts = condition.split("..")
-                    low = float(parts[0])
-                    high = float(parts[1])
-                    val = float(value)
-                    return low <= val <= high
-                except (ValueError, TypeError, IndexError):
-                    return False
-
-            # List: "[A,B,C]"
-            if condition.startswith("[") and condition.endswith("]"):
-                try:
-                    items = [item.strip() for item in condition[1:-1].split(",")]
-                    return value in items
-                except Exception:
-                    return False
-
-        return False
+        return _compile_cell(condition)(value)
 
     def _apply_hit_policy(self, matched_rows: List[DecisionTableRow],
                          context: Dict[str, Any]) -> DecisionTableResult:
@@ -402,17 +764,11 @@ class DecisionTable:
 
     def _build_output_dict(self, row: DecisionTableRow) -> Dict[str, Any]:
         """Build output dictionary from a row"""
-        return {
-            col.name: row.outputs[i]
-            for i, col in enumerate(self.output_columns)
-        }
+        return dict(zip(self._output_names, row.outputs))
 
     def _get_default_outputs(self) -> Dict[str, Any]:
-        """Get default output values"""
-        return {
-            col.name: col.default_value
-            for col in self.output_columns
-        }
+        """Get default output values (a fresh copy of the prebuilt template)"""
+        return self._default_outputs.copy()
 
     def _default_result(self, reason: str) -> DecisionTableResult:
         """Create a default result with no matches"""
@@ -436,11 +792,13 @@ class DecisionTable:
         """Remove a row by ID"""
         original_len = len(self.rows)
         self.rows = [r for r in self.rows if r.row_id != row_id]
+        self._invalidate_indexes()
         return len(self.rows) < original_len
 
     def clear_rows(self) -> None:
         """Remove all rows"""
         self.rows.clear()
+        self._invalidate_indexes()
 
     def validate_completeness(self) -> List[str]:
         """
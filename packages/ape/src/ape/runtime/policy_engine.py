@@ -7,10 +7,14 @@ Author: David Van Aelst
 Status: Decision Engine v2024 - Complete
 """
 
-from typing import Any, Dict, List, Optional, Set
-from dataclasses import dataclass
+import bisect
+from types import CodeType
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+from dataclasses import dataclass, field
 from enum import Enum
 
+from ape.runtime.condition import ConditionFn, compile_condition, free_names
+
 
 class PolicyAction(Enum):
     """Policy enforcement actions"""
@@ -30,10 +34,21 @@ class PolicyRule:
     priority: int = 0  # Higher priority wins on conflicts
     reason: Optional[str] = None  # Human-readable explanation
     metadata: Optional[Dict[str, Any]] = None  # Additional context
+    compiled: Optional[CodeType] = field(default=None, init=False, repr=False, compare=False)
+    predicate: Optional[ConditionFn] = field(default=None, init=False, repr=False, compare=False)
+    required_names: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
+        # Compile once so evaluation does not re-parse the condition
+        filename = f"<policy:{self.name}>"
+        try:
+            self.compiled = compile(self.condition, filename, "eval")
+        except SyntaxError:
+            self.compiled = None  # Evaluates to no match, as before
+        self.predicate = compile_condition(self.condition, filename)
+        self.required_names = free_names(self.condition)
 
 
 @dataclass
@@ -92,9 +107,9 @@ class PolicyEngine:
             priority=priority,
             reason=reason
         )
-        self.policies.append(policy)
-        # Keep sorted by priority (descending)
-        self.policies.sort(key=lambda p: p.priority, reverse=True)
+        # Keep sorted by priority (descending); equal priorities stay in
+        # insertion order, matching the previous stable sort
+        bisect.insort(self.policies, policy, key=lambda p: -p.priority)
 
     def remove_policy(self, name: str) -> bool:
         """
@@ -131,11 +146,22 @@ class PolicyEngine:
             )
 
         matched: List[PolicyRule] = []
+        # Policies sharing a condition see the same unmodified context within
+        # this call, so each distinct condition is evaluated once
+        outcomes: Dict[str, bool] = {}
 
         # Evaluate all policies (already sorted by priority)
         for policy in self.policies:
             # Evaluate condition against context
-            if self._evaluate_condition(policy.condition, context, executor):
+            met = outcomes.get(policy.condition)
+            if met is None:
+                met = outcomes[policy.condition] = self._evaluate_condition(
+                    policy.condition, context, executor,
+                    compiled=policy.compiled,
+                    predicate=policy.predicate,
+                    required_names=policy.required_names
+                )
+            if met:
                 matched.append(policy)
 
         # No matches = default allow
@@ -164,7 +190,10 @@ class PolicyEngine:
         return decision
 
     def _evaluate_condition(self, condition: str, context: Dict[str, Any],
-                           executor: Optional[Any]) -> bool:
+                           executor: Optional[Any],
+                           compiled: Optional[CodeType] = None,
+                           predicate: Optional[ConditionFn] = None,
+                           required_names: FrozenSet[str] = frozenset()) -> bool:
         """
         Evaluate a condition expression.
 
@@ -172,11 +201,21 @@ class PolicyEngine:
             condition: APE expression string
             context: Context variables
             executor: RuntimeExecutor instance
+            compiled: Precompiled form of condition for the fallback evaluator
+            predicate: Closure from compile_condition, preferred when present
 
         Returns:
             True if condition evaluates to truthy value
         """
-        if executor is None:
+        if executor is None and not required_names <= context.keys():
+            return False  # A name missing from the context can only raise
+        
+        if executor is None and predicate is not None:
+            try:
+                return bool(predicate(context))
+            except Exception:
+                return False
+        elif executor is None:
             # Simple fallback: convert dicts to objects for dot notation support
             try:
                 # Wrapper class that allows dict.key notation
@@ -196,7 +235,8 @@ class PolicyEngine:
                     else:
                         namespace[key] = value
 
-                result = eval(condition, {"__builtins__": {}}, namespace)
+                code = compiled if compiled is not None else condition
+                result = eval(code, {"__builtins__": {}}, namespace)
                 return bool(result)
             except Exception:
                 return False
@@ -7,10 +7,29 @@ Author: David Van Aelst
 Status: Decision Engine v2024 - Complete
 """
 
-from typing import Any, Dict, List, Optional, Callable
+import sys
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ape.runtime.condition import ConditionFn, compile_condition, free_names
+
+
+@lru_cache(maxsize=1024)
+def _parse_action(action: str) -> Optional[Tuple[str, str]]:
+    """
+    Split an assignment action into (variable, expression).
+
+    Actions are fixed at rule creation, so the split is done once per
+    distinct action. The variable name is interned so that the output
+    dict writes and later context lookups compare keys by identity.
+    """
+    if '=' not in action:
+        return None
+    var_name, expression = action.split('=', 1)
+    return sys.intern(var_name.strip()), expression.strip()
+
 
 class RuleMode(Enum):
     """Rule evaluation modes"""
@@ -37,6 +56,14 @@ class WhenThenRule:
     priority: int = 0
     enabled: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
+    predicate: Optional[ConditionFn] = field(default=None, init=False, repr=False, compare=False)
+    required_names: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Compile once so evaluation does not re-parse the condition
+        if self.when_condition:
+            self.predicate = compile_condition(self.when_condition, f"<rule:{self.name}>")
+            self.required_names = free_names(self.when_condition)
 
 
 @dataclass
@@ -158,6 +185,8 @@ class RuleEngine:
         results: List[RuleResult] = []
         combined_outputs = dict(context)  # Start with input context
         matched_count = 0
+        # FIRST_MATCH and PRIORITY stop at the first matching rule
+        stop_at_first = self.mode in (RuleMode.FIRST_MATCH, RuleMode.PRIORITY)
         
         for rule in self.rules:
             if not rule.enabled:
@@ -167,7 +196,9 @@ class RuleEngine:
             condition_met = self._evaluate_condition(
                 rule.when_condition, 
                 combined_outputs,  # Use accumulated context
-                executor
+                executor,
+                predicate=rule.predicate,
+                required_names=rule.required_names
             )
             
             # Execute appropriate actions
@@ -196,7 +227,7 @@ class RuleEngine:
             results.append(result)
             
             # Stop at first match if in FIRST_MATCH or PRIORITY mode
-            if (self.mode in (RuleMode.FIRST_MATCH, RuleMode.PRIORITY)) and condition_met:
+            if stop_at_first and condition_met:
                 break
         
         return RuleSetResult(
@@ -207,12 +238,22 @@ class RuleEngine:
         )
     
     def _evaluate_condition(self, condition: str, context: Dict[str, Any],
-                           executor: Optional[Any]) -> bool:
+                           executor: Optional[Any],
+                           predicate: Optional[ConditionFn] = None,
+                           required_names: FrozenSet[str] = frozenset()) -> bool:
         """Evaluate a when condition"""
         if not condition:
             return True  # Empty condition = always true
         
-        if executor is None:
+        if executor is None and not required_names <= context.keys():
+            return False  # A name missing from the context can only raise
+        
+        if executor is None and predicate is not None:
+            try:
+                return bool(predicate(context))
+            except Exception:
+                return False
+        elif executor is None:
             # Fallback: convert dicts to objects for dot notation support
             try:
                 class DictWrapper:
@@ -268,10 +309,9 @@ class RuleEngine:
         
         for action in actions:
             # Parse assignment: "variable = expression"
-            if '=' in action:
-                parts = action.split('=', 1)
-                var_name = parts[0].strip()
-                expression = parts[1].strip()
+            parsed = _parse_action(action)
+            if parsed is not None:
+                var_name, expression = parsed
                 
                 # Evaluate expression
                 if executor is None:
@@ -4,7 +4,9 @@ APE Standard Library - Collections Module
 Pure collection manipulation functions.
 """
 
-from typing import Any, List, Callable
+from functools import reduce as _reduce
+from itertools import groupby
+from typing import Any, Callable, Iterator, List, Tuple
 
 
 def count(items: List[Any]) -> int:
@@ -142,19 +144,10 @@ def reduce(items: List[Any], reducer: Callable[[Any, Any], Any], initial: Any =
     if not items:
         return initial
     
+    # initial=None means "seed with the first item", as before
     if initial is None:
-        if not items:
-            raise ValueError("reduce of empty sequence with no initial value")
-        acc = items[0]
-        start_idx = 1
-    else:
-        acc = initial
-        start_idx = 0
-    
-    for item in items[start_idx:]:
-        acc = reducer(acc, item)
-    
-    return acc
+        return _reduce(reducer, items)
+    return _reduce(reducer, items, initial)
 
 
 def reverse(items: List[Any]) -> List[Any]:
@@ -303,15 +296,58 @@ def group_by(items: List[Any], key_func: Callable[[Any], Any]) -> dict:
         raise TypeError(f"group_by requires callable key_func, got {type(key_func).__name__}")
     
     result = {}
+    bucket = None
+    current_key = None
     for item in items:
         key = key_func(item)
-        if key not in result:
-            result[key] = []
-        result[key].append(item)
+        # Runs of equal keys (e.g. input already sorted by key) reuse the
+        # open bucket without probing the dict
+        if bucket is not None and (key is current_key or key == current_key):
+            bucket.append(item)
+            continue
+        
+        current_key = key
+        bucket = result.get(key)
+        if bucket is None:
+            bucket = result[key] = [item]
+        else:
+            bucket.append(item)
     
     return result
 
 
+def group_by_iter(items: List[Any], key_func: Callable[[Any], Any]) -> Iterator[Tuple[Any, Iterator[Any]]]:
+    """
+    Lazily group items by a key function.
+    
+    Sorts by key, then yields (key, group) pairs on demand without
+    building a list per group. Each group iterator is only valid until
+    the next pair is requested.
+    
+    Example:
+        for dept, rows in group_by_iter(records, lambda r: r["dept"]):
+            total = sum(r["score"] for r in rows)
+    
+    Args:
+        items: Collection to group
+        key_func: Function to extract grouping key from each item
+            (keys must be mutually orderable)
+    
+    Returns:
+        Iterator of (key, group iterator) pairs in ascending key order
+    
+    Author: David Van Aelst
+    Status: Decision Engine v2024
+    """
+    if not isinstance(items, list):
+        raise TypeError(f"group_by_iter requires list, got {type(items).__name__}")
+    
+    if not callable(key_func):
+        raise TypeError(f"group_by_iter requires callable key_func, got {type(key_func).__name__}")
+    
+    return groupby(sorted(items, key=key_func), key=key_func)
+
+
 def unique(items: List[Any]) -> List[Any]:
     """
     Return unique items from a collection (preserving order).
@@ -331,6 +367,12 @@ def unique(items: List[Any]) -> List[Any]:
     if not isinstance(items, list):
         raise TypeError(f"unique requires list, got {type(items).__name__}")
     
+    try:
+        # dicts keep insertion order, so this is first-occurrence dedup
+        return list(dict.fromkeys(items))
+    except TypeError:
+        pass
+    
     seen = set()
     result = []
     for item in items:
@@ -406,6 +448,44 @@ def min_value(items: List[Any], key: Callable[[Any], Any] = None) -> Any:
     return min(items, key=key)
 
 
+def minmax(items: List[Any], key: Callable[[Any], Any] = None) -> tuple:
+    """
+    Find minimum and maximum values in a collection together.
+    
+    Example:
+        minmax([1, 5, 3])  # (1, 5)
+        minmax(records, key=lambda r: r["score"])  # (lowest, highest) record
+    
+    Args:
+        items: Collection to search
+        key: Optional function to extract comparison value
+            (called once per item)
+    
+    Returns:
+        Tuple of (minimum item, maximum item), same ties as min_value/max_value
+    
+    Raises:
+        ValueError: If collection is empty
+    
+    Author: David Van Aelst
+    Status: Decision Engine v2024
+    """
+    if not isinstance(items, list):
+        raise TypeError(f"minmax requires list, got {type(items).__name__}")
+    
+    if not items:
+        raise ValueError("minmax of empty sequence")
+    
+    if key is None:
+        return (min(items), max(items))
+    
+    # Evaluate the key once per item and share it between both scans
+    keys = list(map(key, items))
+    indices = range(len(items))
+    return (items[min(indices, key=keys.__getitem__)],
+            items[max(indices, key=keys.__getitem__)])
+
+
 def sum_values(items: List[Any]) -> Any:
     """
     Sum numeric values in a collection.
@@ -451,7 +531,7 @@ def any_match(items: List[Any], predicate: Callable[[Any], bool]) -> bool:
     if not callable(predicate):
         raise TypeError(f"any_match requires callable predicate, got {type(predicate).__name__}")
     
-    return any(predicate(item) for item in items)
+    return any(map(predicate, items))
 
 
 def all_match(items: List[Any], predicate: Callable[[Any], bool]) -> bool:
@@ -477,7 +557,7 @@ def all_match(items: List[Any], predicate: Callable[[Any], bool]) -> bool:
     if not callable(predicate):
         raise TypeError(f"all_match requires callable predicate, got {type(predicate).__name__}")
     
-    return all(predicate(item) for item in items)
+    return all(map(predicate, items))
 
 
 def find(items: List[Any], predicate: Callable[[Any], bool], default: Any = None) -> Any:
@@ -705,8 +785,8 @@ __all__ = [
     'count', 'is_empty', 'contains',
     'filter_items', 'map_items', 'reduce',
     'reverse', 'sort', 'zip_lists', 'enumerate_items',
-    'group_by', 'unique',
-    'max_value', 'min_value', 'sum_values',
+    'group_by', 'group_by_iter', 'unique',
+    'max_value', 'min_value', 'minmax', 'sum_values',
     'any_match', 'all_match',
     'find', 'find_index', 'partition',
     'take', 'skip', 'slice_items', 'chunk', 'join',
@@ -22,6 +22,7 @@ from ape.types.datetime_type import (
     datetime_add_minutes as add_minutes,
     datetime_add_seconds as add_seconds,
     datetime_compare as compare,
+    datetime_compare_batch as compare_batch,
     datetime_format as format,
     datetime_is_weekend as is_weekend,
     datetime_days_between as days_between,
@@ -36,6 +37,6 @@ __all__ = [
     'now', 'parse_iso8601',
     'subtract_days', 'subtract_hours', 'subtract_minutes', 'subtract_seconds',
     'add_days', 'add_hours', 'add_minutes', 'add_seconds',
-    'compare', 'format', 'is_weekend', 'days_between',
+    'compare', 'compare_batch', 'format', 'is_weekend', 'days_between',
     'days', 'hours', 'minutes', 'seconds'
 ]
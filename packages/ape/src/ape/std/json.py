@@ -7,11 +7,36 @@ Author: David Van Aelst
 Status: Scaffold - implementation pending
 """
 
-from typing import Any, Dict, List, Union, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Union, Optional, Tuple
 
 
 JSONValue = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
 
+# (key, list index or None) for each segment of a dotted path
+PathSegments = Tuple[Tuple[str, Optional[int]], ...]
+
+# Sentinel for absent dict keys (None is a valid stored value)
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _compile_path(path: str) -> PathSegments:
+    """
+    Split a dotted path once and pre-parse list indices.
+
+    Paths are usually literals repeated across calls, so caching saves
+    the split and the int() attempt per segment on every lookup.
+    """
+    segments = []
+    for part in path.split('.'):
+        try:
+            index: Optional[int] = int(part)
+        except ValueError:
+            index = None
+        segments.append((part, index))
+    return tuple(segments)
+
 
 def parse(json_string: str) -> JSONValue:
     """
@@ -88,27 +113,22 @@ def get(data: Any, path: str, default: Any = None) -> Any:
     if not path:
         return data
     
-    parts = path.split('.')
     current = data
     
-    for part in parts:
+    for part, index in _compile_path(path):
         if current is None:
             return default
         
-        # Handle dict access
+        # Handle dict access (single probe)
         if isinstance(current, dict):
-            if part not in current:
+            current = current.get(part, _MISSING)
+            if current is _MISSING:
                 return default
-            current = current[part]
         # Handle list/array index access
         elif isinstance(current, list):
-            try:
-                index = int(part)
-                if index < 0 or index >= len(current):
-                    return default
-                current = current[index]
-            except (ValueError, IndexError):
+            if index is None or index < 0 or index >= len(current):
                 return default
+            current = current[index]
         # Handle object attribute access (for records)
         elif hasattr(current, part):
             current = getattr(current, part)
@@ -118,10 +138,18 @@ def get(data: Any, path: str, default: Any = None) -> Any:
     return current
 
 
+def _copy_node(node: Any) -> Union[Dict[str, Any], List[Any]]:
+    """Shallow copy of a container on a set() path; scalars become new dicts"""
+    if isinstance(node, (dict, list)):
+        return node.copy()
+    return {}
+
+
 def set(data: dict, path: str, value: Any) -> dict:
     """
     Set value in nested JSON using dot notation path.
-    Returns new dict (immutable operation).
+    Returns new dict (immutable operation). Subtrees off the path are
+    shared with the input rather than copied.
     
     Example:
         data = {"user": {"name": "Alice"}}
@@ -139,55 +167,44 @@ def set(data: dict, path: str, value: Any) -> dict:
     Author: David Van Aelst
     Status: Decision Engine v2024
     """
-    import copy
-    result = copy.deepcopy(data) if isinstance(data, dict) else {}
+    # Structural sharing: only containers along the path are copied, every
+    # other subtree of the result is the original object
+    result = data.copy() if isinstance(data, dict) else {}
     
     if not path:
         return value if isinstance(value, dict) else result
     
-    parts = path.split('.')
+    segments = _compile_path(path)
     current = result
     
-    for i, part in enumerate(parts[:-1]):
+    for i, (part, index) in enumerate(segments[:-1]):
         # Handle list indexing - check if current is list AND part is numeric
         if isinstance(current, list):
-            try:
-                index = int(part)
-                if 0 <= index < len(current):
-                    # Get the list item, may need to create nested structure
-                    if not isinstance(current[index], (dict, list)):
-                        current[index] = {}
-                    current = current[index]
-                else:
-                    return result  # Index out of bounds
-            except ValueError:
+            if index is None:
                 return result  # Invalid index
+            if 0 <= index < len(current):
+                # Copy the list item, may need to create nested structure
+                current[index] = _copy_node(current[index])
+                current = current[index]
+            else:
+                return result  # Index out of bounds
         else:
             # Dict access - create nested dict if needed
             if part not in current:
                 # Look ahead: is the next part a list index?
-                next_part = parts[i + 1] if i + 1 < len(parts) else None
-                try:
-                    if next_part is not None:
-                        int(next_part)
-                        current[part] = []  # Next is list index, create list
-                    else:
-                        current[part] = {}  # Create dict
-                except (ValueError, TypeError):
+                if segments[i + 1][1] is not None:
+                    current[part] = []  # Next is list index, create list
+                else:
                     current[part] = {}  # Not a number, create dict
-            elif not isinstance(current[part], (dict, list)):
-                current[part] = {}
+            else:
+                current[part] = _copy_node(current[part])
             current = current[part]
     
     # Set final value
-    last_part = parts[-1]
+    last_part, last_index = segments[-1]
     if isinstance(current, list):
-        try:
-            index = int(last_part)
-            if 0 <= index < len(current):
-                current[index] = value
-        except (ValueError, IndexError):
-            pass
+        if last_index is not None and 0 <= last_index < len(current):
+            current[last_index] = value
     else:
         current[last_part] = value
     return result
@@ -215,27 +232,22 @@ def has_path(data: Any, path: str) -> bool:
     if not path:
         return True
     
-    parts = path.split('.')
     current = data
     
-    for part in parts:
+    for part, index in _compile_path(path):
         if current is None:
             return False
         
-        # Handle dict access
+        # Handle dict access (single probe)
         if isinstance(current, dict):
-            if part not in current:
+            current = current.get(part, _MISSING)
+            if current is _MISSING:
                 return False
-            current = current[part]
         # Handle list/array index access
         elif isinstance(current, list):
-            try:
-                index = int(part)
-                if index < 0 or index >= len(current):
-                    return False
-                current = current[index]
-            except (ValueError, IndexError):
+            if index is None or index < 0 or index >= len(current):
                 return False
+            current = current[index]
         # Handle object attribute access
         elif hasattr(current, part):
             current = getattr(current, part)
@@ -256,7 +268,7 @@ def flatten(data: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
     
     Args:
         data: Nested JSON object
-        prefix: Key prefix (used internally for recursion)
+        prefix: Key prefix prepended to every flattened key
     
     Returns:
         Flattened dict with dotted keys
@@ -265,23 +277,26 @@ def flatten(data: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
     Status: Decision Engine v2024 - Complete
     """
     result = {}
-    
-    for key, value in data.items():
-        full_key = f"{prefix}.{key}" if prefix else key
-        
-        if isinstance(value, dict):
-            # Recursively flatten nested dicts
-            result.update(flatten(value, full_key))
-        elif isinstance(value, list):
-            # Flatten list elements with index
-            for i, item in enumerate(value):
-                item_key = f"{full_key}.{i}"
-                if isinstance(item, dict):
-                    result.update(flatten(item, item_key))
-                else:
-                    result[item_key] = item
-        else:
+    # Depth-first over (prefix, entries, entries-come-from-a-list) frames;
+    # leaves go straight into result, with no per-level dicts to merge
+    stack = [(prefix, iter(data.items()), False)]
+    
+    while stack:
+        base, entries, in_list = stack[-1]
+        for key, value in entries:
+            full_key = f"{base}.{key}" if in_list or base else key
+            
+            if isinstance(value, dict):
+                # Descend into nested dicts, resume this level afterwards
+                stack.append((full_key, iter(value.items()), False))
+                break
+            if isinstance(value, list) and not in_list:
+                # Flatten list elements with index (nested lists stay values)
+                stack.append((full_key, enumerate(value), True))
+                break
             result[full_key] = value
+        else:
+            stack.pop()
     
     return result
 
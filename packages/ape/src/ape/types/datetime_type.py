@@ -8,8 +8,21 @@ Status: Decision Engine v2024
 """
 
 from datetime import datetime, timedelta
-from typing import Union
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Union
+from dataclasses import dataclass, field
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso8601(iso_string: str) -> datetime:
+    """
+    Parse ISO-8601 string to a stdlib datetime.
+
+    Memoized: rule literals are parsed on every evaluation, and datetime
+    objects are immutable so cached results can be shared safely.
+    """
+    # fromisoformat accepts the Z (UTC) suffix natively on Python 3.11+
+    return datetime.fromisoformat(iso_string)
 
 
 @dataclass
@@ -49,11 +62,7 @@ class ApeDateTime:
         Returns:
             ApeDateTime instance
         """
-        # Handle Z suffix (UTC)
-        if iso_string.endswith('Z'):
-            iso_string = iso_string[:-1] + '+00:00'
-
-        return cls(datetime.fromisoformat(iso_string))
+        return cls(_parse_iso8601(iso_string))
 
     def to_iso8601(self) -> str:
         """Convert to ISO-8601 string (UTC)."""
@@ -173,6 +182,11 @@ class ApeDuration:
         h = ApeDuration.hours(48)
     """
     _td: timedelta
+    _seconds: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Durations are immutable, so resolve the seconds contract once
+        self._seconds = int(self._td.total_seconds())
 
     @classmethod
     def days(cls, n: int) -> 'ApeDuration':
@@ -201,7 +215,7 @@ class ApeDuration:
 
     def to_seconds(self) -> int:
         """Get total seconds."""
-        return int(self._td.total_seconds())
+        return self._seconds
 
     def total_seconds(self) -> int:
         """Get total seconds (alias for to_seconds)."""
@@ -289,6 +303,12 @@ def datetime_compare(dt1: ApeDateTime, dt2: ApeDateTime) -> int:
     return dt1.compare(dt2)
 
 
+def datetime_compare_batch(dts: List[ApeDateTime], threshold: ApeDateTime) -> List[int]:
+    """Compare many datetimes against one threshold (-1, 0, 1 each)."""
+    t = threshold._dt
+    return [(dt._dt > t) - (dt._dt < t) for dt in dts]
+
+
 def duration_days(n: int) -> ApeDuration:
     """Create duration from days."""
     return ApeDuration.days(n)
@@ -314,6 +334,6 @@ __all__ = [
     'datetime_now', 'datetime_parse_iso8601',
     'datetime_subtract_days', 'datetime_subtract_hours', 'datetime_subtract_minutes', 'datetime_subtract_seconds',
     'datetime_add_days', 'datetime_add_hours', 'datetime_add_minutes', 'datetime_add_seconds',
-    'datetime_compare', 'datetime_format', 'datetime_is_weekend', 'datetime_days_between',
+    'datetime_compare', 'datetime_compare_batch', 'datetime_format', 'datetime_is_weekend', 'datetime_days_between',
     'duration_days', 'duration_hours', 'duration_minutes', 'duration_seconds'
 ]
@@ -0,0 +1,64 @@
+"""
+Shared file helpers for the Ape test modules
+"""
+
+import functools
+import os
+from typing import Iterator, Tuple
+
+
+def scandir_ape(root: str) -> Iterator[str]:
+    """
+    Yield paths of .ape files under root, recursively.
+
+    Uses os.scandir so the file/dir checks come from the cached DirEntry
+    data instead of an extra stat() per entry. Symlinks are not followed.
+    A missing or unreadable directory yields nothing.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from scandir_ape(entry.path)
+                elif entry.name.endswith(".ape") and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+    except (FileNotFoundError, PermissionError):
+        return
+
+
+def read_source(path: "str | os.PathLike[str]") -> str:
+    """
+    Read a small UTF-8 source file with one os.read call.
+
+    Skips the TextIOWrapper that Path.read_text sets up per call. Newlines
+    are normalized to "\\n" as text mode would.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size)]
+        # A regular file is normally read in one call; keep going to EOF anyway
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def ape_files_under(root: str) -> Tuple[str, ...]:
+    """
+    Paths of .ape files under root, walked once per test session.
+
+    Several test modules collect from the same trees (tutorials is scanned
+    by both the language-spec and tutorial tests), so the walk is cached
+    by normalized root.
+    """
+    return _ape_files_under(os.path.normpath(root))
+
+
+@functools.lru_cache(maxsize=None)
+def _ape_files_under(root: str) -> Tuple[str, ...]:
+    return tuple(scandir_ape(root))
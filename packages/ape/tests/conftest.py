@@ -0,0 +1,116 @@
+"""
+Shared pytest configuration for the Ape test suite
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# Make the in-tree package importable regardless of which test file runs first
+_SRC_DIR = Path(__file__).parent.parent / "src"
+if str(_SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(_SRC_DIR))
+
+_TESTS_DIR = Path(__file__).parent
+_JSON_TEST_FILE = "test_json.py"
+# Everything that decides the outcome of the JSON tests
+_JSON_INPUTS = (
+    _SRC_DIR / "ape" / "std" / "json.py",
+    _TESTS_DIR / "stdlib" / _JSON_TEST_FILE,
+    _TESTS_DIR / "conftest.py",
+    _TESTS_DIR / "std" / "conftest.py",
+)
+_JSON_HASH_KEY = "ape/json_inputs_hash"
+
+# Node ids of test_json.py items that passed or were deselected this session
+_json_passed = set()
+_json_deselected = set()
+
+
+def _json_inputs_hash() -> str:
+    """Content digest of ape/std/json.py, test_json.py and the conftest files"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in _JSON_INPUTS:
+        digest.update(str(path.relative_to(_TESTS_DIR.parent)).encode())
+        digest.update(path.read_bytes() if path.exists() else b"<missing>")
+    return digest.hexdigest()
+
+
+def _is_json_test(nodeid: str) -> bool:
+    return nodeid.split("::")[0].endswith(_JSON_TEST_FILE)
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: full compiler-pipeline tests (link, IR, codegen)")
+    # Registered by pytest-xdist when installed; declared here so plain runs stay warning-free
+    config.addinivalue_line("markers", "xdist_group(name): keep tests on the same xdist worker")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-unchanged-json",
+        action="store_true",
+        default=False,
+        help="skip stdlib JSON tests when json.py and its tests are unchanged since the last green run",
+    )
+    parser.addoption(
+        "--drop-scaffolds",
+        action="store_true",
+        default=False,
+        help="deselect tests skipped as unimplemented scaffolds instead of reporting them as skipped",
+    )
+
+
+def _is_scaffold(item) -> bool:
+    """True if the item carries a skip marker for a pending scaffold"""
+    return any(
+        "scaffold" in str(mark.kwargs.get("reason", ""))
+        for mark in item.iter_markers(name="skip")
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--drop-scaffolds"):
+        kept, dropped = [], []
+        for item in items:
+            (dropped if _is_scaffold(item) else kept).append(item)
+        if dropped:
+            config.hook.pytest_deselected(items=dropped)
+            items[:] = kept
+
+    if not config.getoption("--skip-unchanged-json") or config.cache is None:
+        return
+
+    if config.cache.get(_JSON_HASH_KEY, None) != _json_inputs_hash():
+        return
+
+    skip = pytest.mark.skip(reason="json.py and its tests unchanged since last green run")
+    for item in items:
+        if _is_json_test(item.nodeid):
+            item.add_marker(skip)
+
+
+def pytest_deselected(items):
+    _json_deselected.update(item.nodeid for item in items if _is_json_test(item.nodeid))
+
+
+def pytest_runtest_logreport(report):
+    if report.when == "call" and report.passed and _is_json_test(report.nodeid):
+        _json_passed.add(report.nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if not config.getoption("--skip-unchanged-json") or config.cache is None:
+        return
+
+    # Only a green run that actually executed every JSON test may vouch for
+    # the current JSON inputs; items skipped by this hook never reach "call"
+    json_items = {item.nodeid for item in getattr(session, "items", [])
+                  if _is_json_test(item.nodeid)}
+    if (exitstatus == pytest.ExitCode.OK and json_items and not _json_deselected
+            and json_items <= _json_passed):
+        config.cache.set(_JSON_HASH_KEY, _json_inputs_hash())
@@ -0,0 +1,52 @@
+"""
+Shared fixtures for std module tests
+"""
+
+import types
+
+import pytest
+from ape.std import logic, collections, strings, math
+
+
+@pytest.fixture(scope="session")
+def std():
+    """Stdlib modules, imported once and shared across the session"""
+    return types.SimpleNamespace(
+        logic=logic,
+        collections=collections,
+        strings=strings,
+        math=math,
+    )
+
+
+# Compiler pipeline pieces are imported inside the fixtures so that tests
+# selected with -k only pay for the parts they actually request.
+
+@pytest.fixture(scope="session")
+def parse_ape_source_fn():
+    from ape.parser import parse_ape_source
+    return parse_ape_source
+
+
+@pytest.fixture(scope="session")
+def ir_builder_cls():
+    from ape.ir import IRBuilder
+    return IRBuilder
+
+
+@pytest.fixture(scope="session")
+def project_node_cls():
+    from ape.compiler.ir_nodes import ProjectNode
+    return ProjectNode
+
+
+@pytest.fixture(scope="session")
+def codegen_cls():
+    from ape.codegen.python_codegen import PythonCodeGenerator
+    return PythonCodeGenerator
+
+
+@pytest.fixture(scope="session")
+def linker_cls():
+    from ape.linker import Linker
+    return Linker
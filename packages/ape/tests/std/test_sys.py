@@ -4,132 +4,165 @@ Tests for ape_std/sys.ape module
 Verifies that the sys module can be imported, parsed, linked, and compiled.
 """
 
-import unittest
-import sys
-import os
 from pathlib import Path
-import tempfile
+from functools import lru_cache
+
+import pytest
+
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+_APE_STD_DIR = _REPO_ROOT / "ape_std"
+_SYS_MODULE_PATH = _APE_STD_DIR / "sys.ape"
+
+
+@lru_cache(maxsize=1)
+def _sys_source(path: str) -> str:
+    """Read sys.ape once and reuse the decoded source across tests"""
+    return Path(path).read_text(encoding="utf-8")
+
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+# User module shared by the compilation pipeline tests
+_USE_SYS_APE_SRC = """module use_sys
 
-from ape.parser import parse_ape_source
-from ape.ir import IRBuilder
-from ape.compiler.ir_nodes import ProjectNode
-from ape.codegen.python_codegen import PythonCodeGenerator
-from ape.linker import Linker
+import sys
+
+task main:
+    inputs:
+        message: String
+    outputs:
+        done: Boolean
 
+    constraints:
+        - deterministic
+    steps:
+        - call sys.print with message
+        - return done
+"""
+
+
+# Tests using these fixtures are grouped with xdist_group("compiler_pipeline")
+# so `pytest -n auto --dist=loadgroup` keeps them on one worker and the
+# link/codegen pass still runs once.
+
+@pytest.fixture(scope="module")
+def use_sys_program(tmp_path_factory, linker_cls):
+    """Linked program for _USE_SYS_APE_SRC, shared by the module"""
+    test_file = tmp_path_factory.mktemp("use_sys") / "use_sys.ape"
+    test_file.write_text(_USE_SYS_APE_SRC)
+    return linker_cls().link(test_file)
+
+
+@pytest.fixture(scope="module")
+def use_sys_files(use_sys_program, ir_builder_cls, project_node_cls, codegen_cls):
+    """Generated Python files for use_sys and sys, keyed by module name"""
+    builder = ir_builder_cls()
+    ir_modules = [
+        builder.build_module(resolved_module.ast, str(resolved_module.file_path))
+        for resolved_module in use_sys_program.modules
+    ]
+    
+    project = project_node_cls(name="UseSys", modules=ir_modules)
+    files = codegen_cls(project).generate()
+    
+    # Should generate files for both modules
+    assert len(files) == 2
+    return {module.name: file for module, file in zip(ir_modules, files)}
 
-class TestSysModule(unittest.TestCase):
+
+class TestSysModule:
     """Test the sys standard library module"""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self):
         """Set up test fixtures"""
-        # Get the ape_std directory
-        self.repo_root = Path(__file__).parent.parent.parent
-        self.ape_std_dir = self.repo_root / "ape_std"
-        self.sys_module_path = self.ape_std_dir / "sys.ape"
-        
-        self.assertTrue(self.sys_module_path.exists(), 
-                       f"sys.ape not found at {self.sys_module_path}")
+        assert _SYS_MODULE_PATH.exists(), \
+            f"sys.ape not found at {_SYS_MODULE_PATH}"
     
     def test_sys_module_exists(self):
         """Test that sys.ape exists in ape_std/"""
-        self.assertTrue(self.sys_module_path.exists())
-        self.assertTrue(self.sys_module_path.is_file())
+        assert _SYS_MODULE_PATH.exists()
+        assert _SYS_MODULE_PATH.is_file()
     
-    def test_sys_module_parses(self):
+    def test_sys_module_parses(self, parse_ape_source_fn):
         """Test that sys.ape can be parsed"""
-        source = self.sys_module_path.read_text()
-        ast = parse_ape_source(source, "sys.ape")
+        source = _sys_source(str(_SYS_MODULE_PATH))
+        ast = parse_ape_source_fn(source, "sys.ape")
         
-        self.assertEqual(ast.name, "sys")
-        self.assertTrue(len(ast.tasks) > 0, "sys module should have tasks")
+        assert ast.name == "sys"
+        assert len(ast.tasks) > 0, "sys module should have tasks"
     
-    def test_sys_module_has_expected_functions(self):
+    def test_sys_module_has_expected_functions(self, parse_ape_source_fn):
         """Test that sys module has the expected functions"""
-        source = self.sys_module_path.read_text()
-        ast = parse_ape_source(source, "sys.ape")
+        source = _sys_source(str(_SYS_MODULE_PATH))
+        ast = parse_ape_source_fn(source, "sys.ape")
         
         task_names = [t.name for t in ast.tasks]
         
         # Check for system operations
-        self.assertIn("print", task_names)
-        self.assertIn("exit", task_names)
+        assert "print" in task_names
+        assert "exit" in task_names
     
-    def test_sys_module_builds_ir(self):
+    def test_sys_module_builds_ir(self, parse_ape_source_fn, ir_builder_cls):
         """Test that sys module can be converted to IR"""
-        source = self.sys_module_path.read_text()
-        ast = parse_ape_source(source, "sys.ape")
+        source = _sys_source(str(_SYS_MODULE_PATH))
+        ast = parse_ape_source_fn(source, "sys.ape")
         
-        builder = IRBuilder()
+        builder = ir_builder_cls()
         ir_module = builder.build_module(ast, "sys.ape")
         
-        self.assertEqual(ir_module.name, "sys")
-        self.assertTrue(len(ir_module.tasks) > 0)
+        assert ir_module.name == "sys"
+        assert len(ir_module.tasks) > 0
     
-    def test_sys_module_generates_code(self):
+    @pytest.mark.slow
+    @pytest.mark.xdist_group(name="compiler_pipeline")
+    def test_sys_module_generates_code(self, use_sys_files):
         """Test that sys module generates Python code"""
-        source = self.sys_module_path.read_text()
-        ast = parse_ape_source(source, "sys.ape")
-        
-        builder = IRBuilder()
-        ir_module = builder.build_module(ast, "sys.ape")
-        
-        project = ProjectNode(name="TestSys", modules=[ir_module])
-        codegen = PythonCodeGenerator(project)
-        files = codegen.generate()
-        
-        self.assertEqual(len(files), 1)
-        content = files[0].content
+        content = use_sys_files["sys"].content
         
         # Check that functions are generated with proper name mangling
-        self.assertIn("def sys__print(", content)
-        self.assertIn("def sys__exit(", content)
+        assert "def sys__print(" in content
+        assert "def sys__exit(" in content
     
-    def test_sys_print_signature(self):
+    def test_sys_print_signature(self, parse_ape_source_fn):
         """Test that sys.print has correct signature"""
-        source = self.sys_module_path.read_text()
-        ast = parse_ape_source(source, "sys.ape")
+        source = _sys_source(str(_SYS_MODULE_PATH))
+        ast = parse_ape_source_fn(source, "sys.ape")
         
         print_task = next((t for t in ast.tasks if t.name == "print"), None)
-        self.assertIsNotNone(print_task, "print task should exist")
+        assert print_task is not None, "print task should exist"
         
         # Check inputs - should have message
         input_names = [f.name for f in print_task.inputs]
-        self.assertIn("message", input_names)
+        assert "message" in input_names
         
         # Check outputs - should have success indicator
-        self.assertTrue(len(print_task.outputs) > 0)
+        assert len(print_task.outputs) > 0
     
-    def test_sys_exit_signature(self):
+    def test_sys_exit_signature(self, parse_ape_source_fn):
         """Test that sys.exit has correct signature"""
-        source = self.sys_module_path.read_text()
-        ast = parse_ape_source(source, "sys.ape")
+        source = _sys_source(str(_SYS_MODULE_PATH))
+        ast = parse_ape_source_fn(source, "sys.ape")
         
         exit_task = next((t for t in ast.tasks if t.name == "exit"), None)
-        self.assertIsNotNone(exit_task, "exit task should exist")
+        assert exit_task is not None, "exit task should exist"
         
         # Check inputs - should have exit code
         input_names = [f.name for f in exit_task.inputs]
-        self.assertIn("code", input_names)
+        assert "code" in input_names
         
         # Check outputs
-        self.assertTrue(len(exit_task.outputs) > 0)
+        assert len(exit_task.outputs) > 0
 
 
-class TestSysImport(unittest.TestCase):
+@pytest.mark.slow
+@pytest.mark.xdist_group(name="compiler_pipeline")
+class TestSysImport:
     """Test importing sys module from user code"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.repo_root = Path(__file__).parent.parent.parent
-    
-    def test_import_sys_module(self):
+    def test_import_sys_module(self, tmp_path, linker_cls):
         """Test that user code can import sys module"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.ape"
-            test_file.write_text("""module test
+        test_file = tmp_path / "test.ape"
+        test_file.write_text("""module test
 
 import sys
 
@@ -146,79 +179,35 @@ task greet:
         - call sys.print with greeting
         - return success
 """)
-            
-            # Link the program
-            linker = Linker()
-            result = linker.link(test_file)
-            
-            # Verify sys module was linked
-            module_names = [m.module_name for m in result.modules]
-            self.assertIn("sys", module_names)
-            self.assertIn("test", module_names)
+        
+        # Link the program
+        linker = linker_cls()
+        result = linker.link(test_file)
+        
+        # Verify sys module was linked
+        module_names = [m.module_name for m in result.modules]
+        assert "sys" in module_names
+        assert "test" in module_names
     
-    def test_sys_module_compilation_pipeline(self):
+    def test_sys_module_compilation_pipeline(self, use_sys_files):
         """Test complete compilation pipeline with sys module"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "use_sys.ape"
-            test_file.write_text("""module use_sys
-
-import sys
+        # Should generate files for both modules
+        assert set(use_sys_files) == {"sys", "use_sys"}
+        
+        # Check that sys functions are available
+        sys_file = use_sys_files["sys"]
+        assert "def sys__print(" in sys_file.content
+        assert "def sys__exit(" in sys_file.content
 
-task main:
-    inputs:
-        message: String
-    outputs:
-        done: Boolean
 
-    constraints:
-        - deterministic
-    steps:
-        - call sys.print with message
-        - return done
-""")
-            
-            # Parse and link
-            linker = Linker()
-            linked_program = linker.link(test_file)
-            
-            # Build IR from AST modules
-            builder = IRBuilder()
-            ir_modules = []
-            for resolved_module in linked_program.modules:
-                ir_module = builder.build_module(
-                    resolved_module.ast,
-                    str(resolved_module.file_path)
-                )
-                ir_modules.append(ir_module)
-            
-            # Generate code
-            project = ProjectNode(
-                name="UseSys",
-                modules=ir_modules
-            )
-            codegen = PythonCodeGenerator(project)
-            files = codegen.generate()
-            
-            # Should generate files for both modules
-            self.assertEqual(len(files), 2)
-            
-            # Check that sys functions are available
-            sys_file = next((f for f in files if "sys" in f.path), None)
-            self.assertIsNotNone(sys_file)
-            self.assertIn("def sys__print(", sys_file.content)
-            self.assertIn("def sys__exit(", sys_file.content)
-
-
-class TestSysFunctionProperties(unittest.TestCase):
+class TestSysFunctionProperties:
     """Test properties of sys module functions"""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, parse_ape_source_fn):
         """Set up test fixtures"""
-        self.repo_root = Path(__file__).parent.parent.parent
-        self.sys_module_path = self.repo_root / "ape_std" / "sys.ape"
-        
-        source = self.sys_module_path.read_text()
-        self.ast = parse_ape_source(source, "sys.ape")
+        source = _sys_source(str(_SYS_MODULE_PATH))
+        self.ast = parse_ape_source_fn(source, "sys.ape")
     
     def test_all_functions_are_deterministic(self):
         """Test that all sys functions are marked deterministic"""
@@ -228,18 +217,16 @@ class TestSysFunctionProperties(unittest.TestCase):
                 "deterministic" in str(c).lower() 
                 for c in task.constraints
             )
-            self.assertTrue(has_deterministic, 
-                          f"Task {task.name} should be deterministic")
+            assert has_deterministic, \
+                f"Task {task.name} should be deterministic"
     
     def test_functions_have_valid_signatures(self):
         """Test that sys functions have valid signatures"""
         for task in self.ast.tasks:
             # All tasks should have inputs and outputs
-            self.assertTrue(len(task.inputs) > 0, 
-                          f"{task.name} should have inputs")
-            self.assertTrue(len(task.outputs) > 0, 
-                          f"{task.name} should have outputs")
+            assert len(task.inputs) > 0, f"{task.name} should have inputs"
+            assert len(task.outputs) > 0, f"{task.name} should have outputs"
 
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__, "-v"])
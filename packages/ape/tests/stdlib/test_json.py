@@ -11,25 +11,29 @@ import pytest
 from ape.std import json
 
 
+# Shared read-only payloads. json.get/has_path/set only accept real dicts
+# (MappingProxyType would fall through to attribute access), so these are
+# plain dicts; test_set_nested_value checks json.set leaves them untouched.
+_USER = {"user": {"name": "Alice"}}
+_USER_WITH_ADDRESS = {"user": {"name": "Alice", "address": {"city": "NYC"}}}
+
+
 class TestJSONParsing:
     """Test cases for JSON parsing"""
     
-    def test_parse_object(self):
-        """Test parsing JSON object"""
-        data = json.parse('{"name": "Alice", "age": 30}')
-        assert data["name"] == "Alice"
-        assert data["age"] == 30
-    
-    def test_parse_array(self):
-        """Test parsing JSON array"""
-        data = json.parse('[1, 2, 3]')
-        assert data == [1, 2, 3]
-    
-    def test_parse_nested(self):
-        """Test parsing nested JSON structures"""
-        data = json.parse('{"user": {"name": "Bob", "address": {"city": "NYC"}}}')
-        assert data["user"]["name"] == "Bob"
-        assert data["user"]["address"]["city"] == "NYC"
+    @pytest.mark.parametrize("source,path,expected", [
+        ('{"name": "Alice", "age": 30}', ["name"], "Alice"),
+        ('{"name": "Alice", "age": 30}', ["age"], 30),
+        ('[1, 2, 3]', [], [1, 2, 3]),
+        ('{"user": {"name": "Bob", "address": {"city": "NYC"}}}', ["user", "name"], "Bob"),
+        ('{"user": {"name": "Bob", "address": {"city": "NYC"}}}', ["user", "address", "city"], "NYC"),
+    ], ids=["object_name", "object_age", "array", "nested_name", "nested_city"])
+    def test_parse(self, source, path, expected):
+        """Test parsing JSON objects, arrays and nested structures"""
+        data = json.parse(source)
+        for key in path:
+            data = data[key]
+        assert data == expected
     
     def test_parse_malformed(self):
         """Test parsing malformed JSON raises error"""
@@ -66,26 +70,23 @@ class TestJSONPathAccess:
     
     def test_get_nested_value(self):
         """Test getting nested value with dot notation"""
-        data = {"user": {"name": "Alice", "address": {"city": "NYC"}}}
-        assert json.get(data, "user.name") == "Alice"
-        assert json.get(data, "user.address.city") == "NYC"
+        assert json.get(_USER_WITH_ADDRESS, "user.name") == "Alice"
+        assert json.get(_USER_WITH_ADDRESS, "user.address.city") == "NYC"
     
     def test_get_with_default(self):
         """Test get with default value for missing path"""
-        data = {"user": {"name": "Alice"}}
-        assert json.get(data, "user.phone", "N/A") == "N/A"
-        assert json.get(data, "missing.path", None) is None
+        assert json.get(_USER, "user.phone", "N/A") == "N/A"
+        assert json.get(_USER, "missing.path", None) is None
     
     def test_set_nested_value(self):
         """Test setting nested value with dot notation"""
-        data = {"user": {"name": "Alice"}}
-        result = json.set(data, "user.email", "alice@example.com")
+        result = json.set(_USER, "user.email", "alice@example.com")
         assert result["user"]["email"] == "alice@example.com"
         assert result["user"]["name"] == "Alice"  # Original value preserved
+        assert _USER == {"user": {"name": "Alice"}}  # Input not mutated
     
     def test_has_path(self):
         """Test checking path existence"""
-        data = {"user": {"name": "Alice"}}
-        assert json.has_path(data, "user.name") is True
-        assert json.has_path(data, "user.email") is False
-        assert json.has_path(data, "missing") is False
+        assert json.has_path(_USER, "user.name") is True
+        assert json.has_path(_USER, "user.email") is False
+        assert json.has_path(_USER, "missing") is False
@@ -51,6 +51,38 @@ class TestGrouping:
         result = collections.group_by([], lambda x: x)
         assert result == {}
 
+    def test_group_by_sorted_runs(self):
+        """group_by on input clustered by key keeps each run together."""
+        items = [1, 1, 1, 2, 2, 3]
+
+        result = collections.group_by(items, lambda x: x)
+
+        assert result == {1: [1, 1, 1], 2: [2, 2], 3: [3]}
+        assert list(result) == [1, 2, 3]
+
+    def test_group_by_interleaved_runs(self):
+        """group_by merges a key that reappears after another key's run."""
+        items = ["a1", "a2", "b1", "a3", "b2"]
+
+        result = collections.group_by(items, lambda x: x[0])
+
+        assert result == {"a": ["a1", "a2", "a3"], "b": ["b1", "b2"]}
+
+    def test_group_by_iter_streams_sorted_groups(self):
+        """group_by_iter yields groups in key order for streaming aggregation."""
+        records = [
+            {"dept": "B", "score": 20},
+            {"dept": "A", "score": 10},
+            {"dept": "A", "score": 15},
+        ]
+
+        totals = [
+            (dept, sum(r["score"] for r in rows))
+            for dept, rows in collections.group_by_iter(records, lambda r: r["dept"])
+        ]
+
+        assert totals == [("A", 25), ("B", 20)]
+
 
 class TestUnique:
     """Test unique collection function."""
@@ -80,6 +112,13 @@ class TestUnique:
         assert set(result) == {"a", "b", "c"}
 
 
+    def test_unique_unhashable_items(self):
+        """unique falls back to equality for unhashable values."""
+        items = [[1], 2, [1], 2, {"a": 1}, {"a": 1}]
+        result = collections.unique(items)
+
+        assert result == [[1], 2, {"a": 1}]
+
 class TestAggregations:
     """Test aggregation functions."""
 
@@ -104,6 +143,23 @@ class TestAggregations:
 
         assert result == 5
 
+    def test_minmax(self):
+        """minmax matches min_value/max_value and calls key once per item."""
+        records = [{"id": 1, "s": 3}, {"id": 2, "s": 9}, {"id": 3, "s": 1}, {"id": 4, "s": 9}]
+        calls = []
+
+        def score(r):
+            calls.append(r["id"])
+            return r["s"]
+
+        low, high = collections.minmax(records, key=score)
+
+        assert (low["id"], high["id"]) == (3, 2)
+        assert calls == [1, 2, 3, 4]
+        assert collections.minmax([10, 5, 20, 15]) == (5, 20)
+        with pytest.raises(ValueError):
+            collections.minmax([])
+
     def test_aggregations_with_floats(self):
         """Aggregations work with floats."""
         items = [1.5, 2.3, 0.7]
@@ -154,6 +210,21 @@ class TestPredicates:
         result = collections.all_match([], lambda x: False)
         assert result is True
 
+    def test_predicates_short_circuit(self):
+        """any_match/all_match stop calling the predicate once decided."""
+        seen = []
+
+        def check(x):
+            seen.append(x)
+            return x > 1
+
+        assert collections.any_match([1, 2, 3, 4], check) is True
+        assert seen == [1, 2]
+
+        seen.clear()
+        assert collections.all_match([2, 0, 3], check) is False
+        assert seen == [2, 0]
+
 
 class TestTransformations:
     """Test reduce, sort, reverse transformations."""
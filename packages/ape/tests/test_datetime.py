@@ -102,6 +102,20 @@ class TestDateTimeComparisons:
         result = datetime_module.compare(dt1, dt2)
         assert result == 0
 
+    def test_compare_batch(self):
+        """Batch comparison matches compare for each datetime."""
+        threshold = datetime_module.parse_iso8601("2024-12-17T00:00:00Z")
+        dts = [
+            datetime_module.parse_iso8601("2024-12-15T00:00:00Z"),
+            datetime_module.parse_iso8601("2024-12-17T00:00:00Z"),
+            datetime_module.parse_iso8601("2024-12-20T00:00:00Z"),
+        ]
+
+        result = datetime_module.compare_batch(dts, threshold)
+
+        assert result == [-1, 0, 1]
+        assert result == [datetime_module.compare(dt, threshold) for dt in dts]
+
 
 class TestDuration:
     """Test Duration type runtime behavior."""
@@ -142,6 +156,15 @@ class TestDeterminism:
 
         assert dt1.to_iso8601() == dt2.to_iso8601()
 
+    def test_parse_returns_independent_instances(self):
+        """Repeated parses of one string do not share an ApeDateTime."""
+        iso = "2024-12-17T12:00:00Z"
+        dt1 = datetime_module.parse_iso8601(iso)
+        dt2 = datetime_module.parse_iso8601(iso)
+
+        assert dt1 == dt2
+        assert dt1 is not dt2
+
     def test_arithmetic_deterministic(self):
         """Same arithmetic operations give same results."""
         base = datetime_module.parse_iso8601("2024-12-17T00:00:00Z")
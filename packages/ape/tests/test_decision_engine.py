@@ -12,6 +12,7 @@ from ape.runtime.policy_engine import PolicyEngine, PolicyAction, PolicyRule, Po
 from ape.runtime.rule_engine import RuleEngine, RuleMode, WhenThenRule, RuleResult
 from ape.runtime.decision_table import DecisionTable, HitPolicy, DecisionTableResult
 from ape.runtime.constraint_checker import ConstraintChecker, ConstraintType, ValidationResult
+from ape.runtime.condition import compile_condition, compile_path, free_names
 
 
 # ============================================================================
@@ -58,6 +59,17 @@ def test_policy_engine_priority():
     assert len(decision.matched_rules) == 2
 
 
+def test_policy_engine_equal_priority_keeps_insertion_order():
+    """Test policies with equal priority are evaluated in insertion order"""
+    engine = PolicyEngine()
+    engine.add_policy("first", "amount > 0", PolicyAction.GATE, priority=5)
+    engine.add_policy("low", "amount > 0", PolicyAction.DENY, priority=1)
+    engine.add_policy("second", "amount > 0", PolicyAction.ALLOW, priority=5)
+    engine.add_policy("high", "amount > 0", PolicyAction.ESCALATE, priority=9)
+    
+    assert engine.list_policies() == ["high", "first", "second", "low"]
+
+
 def test_policy_engine_no_match_default_allow():
     """Test default allow when no policies match"""
     engine = PolicyEngine()
@@ -104,6 +116,180 @@ def test_policy_engine_remove_policy():
     assert "temp" not in engine.list_policies()
 
 
+def test_policy_engine_compiles_condition_once():
+    """Test conditions are compiled at add time and bad syntax never matches"""
+    engine = PolicyEngine()
+    engine.add_policy("broken", "amount >", PolicyAction.DENY, priority=10)
+    engine.add_policy("large", "amount > 100", PolicyAction.GATE, priority=1)
+    
+    assert engine.get_policy("broken").compiled is None
+    assert engine.get_policy("large").compiled is not None
+    
+    decision = engine.evaluate({"amount": 500})
+    assert decision.action == PolicyAction.GATE
+    assert decision.matched_rules == ["large"]
+
+
+def test_policy_engine_nested_and_method_access():
+    """Test compiled conditions support nested dicts and value methods"""
+    engine = PolicyEngine()
+    engine.add_policy(
+        "vip", "user.profile.tier.upper() == 'VIP'", PolicyAction.ALLOW, priority=5
+    )
+    engine.add_policy("fallback", "missing_var > 1", PolicyAction.DENY, priority=10)
+    
+    decision = engine.evaluate({"user": {"profile": {"tier": "vip"}}})
+    assert decision.action == PolicyAction.ALLOW
+    assert decision.matched_rules == ["vip"]
+
+
+def test_policy_engine_shared_condition_evaluated_once():
+    """Test policies with the same condition evaluate it once per call"""
+    class CountingExecutor:
+        def __init__(self):
+            self.calls = []
+        
+        def eval_expression_with_context(self, expression, context):
+            self.calls.append(expression)
+            return eval(expression, {"__builtins__": {}}, dict(context))
+    
+    engine = PolicyEngine()
+    engine.add_policy("gate", "amount > 100", PolicyAction.GATE, priority=9)
+    engine.add_policy("audit", "amount > 100", PolicyAction.ALLOW, priority=5)
+    engine.add_policy("small", "amount <= 100", PolicyAction.ALLOW, priority=1)
+    
+    executor = CountingExecutor()
+    decision = engine.evaluate({"amount": 500}, executor)
+    
+    assert decision.matched_rules == ["gate", "audit"]
+    assert executor.calls == ["amount > 100", "amount <= 100"]
+
+
+# ============================================================================
+# Condition Compilation Tests
+# ============================================================================
+
+def test_compile_condition_evaluates_against_context():
+    """Test compiled condition resolves names and dot access from the context"""
+    pred = compile_condition("user.verified == True and amount > 10")
+    
+    assert pred({"user": {"verified": True}, "amount": 11}) is True
+    assert pred({"user": {"verified": False}, "amount": 11}) is False
+
+
+def test_compile_condition_wraps_dict_operands_like_eval_fallback():
+    """Test dict values stay opaque, truthy objects as under DictWrapper"""
+    engine = PolicyEngine()
+    engine.add_policy("has_user", "user", PolicyAction.DENY)
+    assert engine.evaluate({"user": {}}).action == PolicyAction.DENY
+    
+    engine = PolicyEngine()
+    engine.add_policy("literal", "x == {'a': 1}", PolicyAction.DENY)
+    assert engine.evaluate({"x": {"a": 1}}).action == PolicyAction.ALLOW
+    
+    context = {"user": {"name": "ada", "profile": {"tier": "vip"}}, "items": [{"a": 1}]}
+    assert compile_condition("user.profile.tier == 'vip'")(context) is True
+    assert compile_condition("user.profile == user.profile")(context) is True
+    for condition in ("user['name']", "'name' in user", "items[0].a"):
+        with pytest.raises((TypeError, AttributeError)):
+            compile_condition(condition)(context)
+
+
+def test_compile_condition_unknown_name_raises():
+    """Test unknown names raise instead of silently evaluating"""
+    pred = compile_condition("x > 1")
+    
+    with pytest.raises(KeyError):
+        pred({})
+
+
+def test_compile_condition_unsupported():
+    """Test invalid or scoped expressions are not compiled"""
+    assert compile_condition("amount >") is None
+    assert compile_condition("[x for x in items]") is None
+    assert compile_condition("await x") is None
+    assert compile_condition("(yield x)") is None
+
+
+def test_policy_engine_keeps_uncompilable_conditions():
+    """Test conditions that parse but do not compile are stored as no match"""
+    engine = PolicyEngine()
+    engine.add_policy("awaits", "await x", PolicyAction.DENY)
+    engine.add_policy("yields", "(yield x)", PolicyAction.DENY)
+    
+    assert engine.evaluate({"x": 1}).matched_rules == []
+
+
+def test_compile_condition_has_no_builtins():
+    """Test compiled conditions only see the context, like the eval fallback"""
+    pred = compile_condition("len(items) > 0")
+    
+    with pytest.raises(KeyError):
+        pred({"items": [1]})
+
+
+def test_free_names_lists_context_reads():
+    """Test free_names gives the names read on every path, or nothing when unsure"""
+    assert free_names("user.age >= 18 and tier == 'gold'") == {"user"}
+    assert free_names("len(items) + total > 0") == {"len", "items", "total"}
+    assert free_names("True") == frozenset()
+    assert free_names("any(x > 0 for x in items)") == frozenset()
+    assert free_names("(y := x) > 0 and y < 5") == frozenset()
+    assert free_names("x >") == frozenset()
+    assert free_names("age >= 18 or guardian") == {"age"}
+    assert free_names("a if flag else b") == {"flag"}
+    assert free_names("lo <= x <= hi") == {"lo", "x"}
+
+
+def test_rules_and_policies_skip_conditions_with_missing_names():
+    """Test the name pre-check keeps missing-variable conditions unmatched"""
+    engine = PolicyEngine()
+    engine.add_policy("needs_tier", "tier == 'gold'", PolicyAction.DENY, priority=5)
+    assert engine.get_policy("needs_tier").required_names == {"tier"}
+    assert engine.evaluate({"amount": 1}).matched_rules == []
+    
+    rules = RuleEngine(mode=RuleMode.ALL_MATCHES)
+    rules.add_rule("base", when="x > 0", then=["y = x + 1"])
+    rules.add_rule("chained", when="y > 1", then=["z = y"])
+    
+    # "y" is missing from the input but produced by the first rule
+    result = rules.evaluate({"x": 5})
+    assert result.final_outputs["z"] == 6
+
+
+def test_short_circuit_conditions_ignore_skipped_missing_names():
+    """Test a missing name on a skipped branch does not block a match"""
+    engine = PolicyEngine()
+    engine.add_policy("adult", "age >= 18 or guardian", PolicyAction.ALLOW)
+    engine.add_policy("minor", "age < 18 and not guardian", PolicyAction.DENY)
+    assert engine.evaluate({"age": 20}).matched_rules == ["adult"]
+    assert engine.evaluate({"age": 12, "guardian": False}).action == PolicyAction.DENY
+    
+    rules = RuleEngine()
+    rules.add_rule("adult", when="age >= 18 or guardian", then=["ok = True"])
+    assert rules.evaluate({"age": 20}).final_outputs["ok"] is True
+    
+    checker = ConstraintChecker()
+    checker.add_constraint("adult", ConstraintType.PRECONDITION, "guardian if age < 18 else True")
+    assert checker.validate_preconditions({"age": 20}).passed
+
+
+def test_compile_path_reads_dicts_and_attributes():
+    """Test dotted-path getters mix dict keys and attribute access"""
+    from collections import OrderedDict
+    from types import SimpleNamespace
+    
+    getter = compile_path("order.customer.tier")
+    
+    assert getter({"order": {"customer": {"tier": "gold"}}}) == "gold"
+    assert getter({"order": OrderedDict(customer=SimpleNamespace(tier="silver"))}) == "silver"
+    with pytest.raises(KeyError):
+        getter({"order": {}})
+    
+    assert compile_path("amount > 0") is None
+    assert compile_path("user.class") is None
+
+
 # ============================================================================
 # Rule Engine Tests
 # ============================================================================
@@ -219,6 +405,40 @@ def test_rule_engine_multiple_outputs():
     assert result.final_outputs["gift"] == True
 
 
+def test_rule_engine_nested_context_condition():
+    """Test compiled when conditions read nested dicts with dot notation"""
+    engine = RuleEngine()
+    engine.add_rule(
+        "premium",
+        when="customer.tier == 'premium' and order.total > 100",
+        then=["discount = 0.20"],
+        else_actions=["discount = 0.0"]
+    )
+    
+    assert engine.get_rule("premium").predicate is not None
+    
+    result = engine.evaluate({"customer": {"tier": "premium"}, "order": {"total": 150}})
+    assert result.final_outputs["discount"] == 0.20
+    
+    result = engine.evaluate({"customer": {"tier": "basic"}, "order": {"total": 150}})
+    assert result.final_outputs["discount"] == 0.0
+
+
+def test_rule_engine_action_targets_are_interned():
+    """Test action variable names are interned output keys"""
+    import sys
+    
+    engine = RuleEngine()
+    engine.add_rule("flag", when="x > 1", then=["risk_level = 'high'", "score = x * 2"])
+    
+    outputs = engine.evaluate({"x": 5}).final_outputs
+    keys = {k: k for k in outputs}
+    
+    assert outputs["risk_level"] == "high"
+    assert outputs["score"] == 10
+    assert keys["risk_level"] is sys.intern("risk_level")
+
+
 # ============================================================================
 # Decision Table Tests
 # ============================================================================
@@ -272,8 +492,9 @@ def test_decision_table_wildcard():
     assert result.outputs["action"] == "default_action"
 
 
-def test_decision_table_range():
-    """Test range conditions"""
+@pytest.fixture(scope="module")
+def age_range_table():
+    """Range-condition table, built once (evaluate does not mutate it)"""
     table = DecisionTable("age_range", hit_policy=HitPolicy.FIRST)
     table.add_input_column("age", "age")
     table.add_output_column("group", default_value="unknown")
@@ -281,10 +502,13 @@ def test_decision_table_range():
     table.add_row(["0..17"], ["child"])
     table.add_row(["18..64"], ["adult"])
     table.add_row(["65..120"], ["senior"])
-    
-    assert table.evaluate({"age": 10}).outputs["group"] == "child"
-    assert table.evaluate({"age": 30}).outputs["group"] == "adult"
-    assert table.evaluate({"age": 70}).outputs["group"] == "senior"
+    return table
+
+
+@pytest.mark.parametrize("age,group", [(10, "child"), (30, "adult"), (70, "senior")])
+def test_decision_table_range(age_range_table, age, group):
+    """Test range conditions"""
+    assert age_range_table.evaluate({"age": age}).outputs["group"] == group
 
 
 def test_decision_table_collect_mode():
@@ -315,10 +539,15 @@ def test_decision_table_no_match_default():
     
     result = table.evaluate({"category": "normal"})
     assert result.outputs["price"] == 100.0  # Default value
+    
+    # Each result gets its own copy of the defaults
+    result.outputs["price"] = 0.0
+    assert table.evaluate({"category": "normal"}).outputs["price"] == 100.0
 
 
-def test_decision_table_comparison_operators():
-    """Test comparison operators in conditions"""
+@pytest.fixture(scope="module")
+def grade_table():
+    """Comparison-operator table, built once (evaluate does not mutate it)"""
     table = DecisionTable("comparisons", hit_policy=HitPolicy.FIRST)
     table.add_input_column("score", "score")
     table.add_output_column("grade", default_value="F")
@@ -327,11 +556,223 @@ def test_decision_table_comparison_operators():
     table.add_row([">= 80"], ["B"])
     table.add_row([">= 70"], ["C"])
     table.add_row(["< 70"], ["F"])
-    
+    return table
+
+
+@pytest.mark.parametrize("score,grade", [(95, "A"), (85, "B"), (75, "C"), (65, "F")])
+def test_decision_table_comparison_operators(grade_table, score, grade):
+    """Test comparison operators in conditions"""
+    assert grade_table.evaluate({"score": score}).outputs["grade"] == grade
+
+
+def test_decision_table_cells_compiled_at_add_row():
+    """Test cells are parsed once into matchers covering every cell form"""
+    table = DecisionTable("cells", hit_policy=HitPolicy.COLLECT)
+    table.add_input_column("score", "applicant.score")
+    table.add_input_column("tier", "applicant.tier")
+    table.add_output_column("tag", default_value=None)
+
+    table.add_row([">= 700", "[gold, silver]"], ["prime"])
+    table.add_row(["600..699", "!= basic"], ["near"])
+    table.add_row(["< 600", "-"], ["sub"])
+
+    row = table.rows[0]
+    assert len(row.matchers) == 2
+    assert [i for i, _ in table.rows[2].checks] == [0]  # "-" cell is never visited
+    assert table.input_columns[0].extractor is not None
+
+    def tags(score, tier):
+        return table.evaluate({"applicant": {"score": score, "tier": tier}}).outputs["tag"]
+
+    assert tags(720, "silver") == ["prime"]
+    assert tags("650", "gold") is None  # "!= basic" is not numeric: equality only
+    assert tags("650", "!= basic") == ["near"]
+    assert tags(650, "basic") is None  # no match: default
+    assert tags(None, "gold") is None
+    assert tags(599.5, "basic") == ["sub"]
+
+
+def test_decision_table_comparisons_ignore_non_numeric_inputs():
+    """Test comparison cells only compare numerically, else match by equality"""
+    table = DecisionTable("ages", hit_policy=HitPolicy.COLLECT)
+    table.add_input_column("value", "value")
+    table.add_output_column("tag", default_value=None)
+    table.add_row([">= 18"], ["adult"])
+    table.add_row(["!= gold"], ["notgold"])
+
+    def tags(value):
+        return table.evaluate({"value": value}).outputs["tag"]
+
+    assert tags("abc") is None
+    assert tags(None) is None
+    assert tags("4") is None
+    assert tags("gold") is None
+    assert tags("21") == ["adult"]
+    assert tags(21) == ["adult"]
+    assert tags("!= gold") == ["notgold"]
+
+
+@pytest.mark.parametrize("cell,value", [
+    ("== True", True),
+    ("!= True", False),
+    ("== None", None),
+    ("!= None", 0),
+    ("!= 5", None),
+    ("!= 5", [1, 2]),
+    ("!= 5", {"a": 1}),
+    ("== [1, 2]", [1, 2]),
+    ("== 5", "5"),
+])
+def test_decision_table_comparisons_read_python_literals(cell, value):
+    """Test non-numeric comparison operands compare as Python literals"""
+    table = DecisionTable("literals", hit_policy=HitPolicy.FIRST)
+    table.add_input_column("value", "value")
+    table.add_output_column("result", default_value="DEFAULT")
+    table.add_row([cell], ["HIT"])
+
+    assert table.evaluate({"value": value}).outputs["result"] == "HIT"
+
+
+@pytest.mark.parametrize("cell,value", [
+    ("== True", False),
+    ("== None", 0),
+    ("!= 5", 5),
+    ("!= gold", None),
+    ("< 5", None),
+    (">= 18", float("inf")),
+    ("!= 5", float("nan")),
+])
+def test_decision_table_comparisons_without_match(cell, value):
+    """Test literal comparisons still reject mismatches, bare words and inf/nan"""
+    table = DecisionTable("literals", hit_policy=HitPolicy.FIRST)
+    table.add_input_column("value", "value")
+    table.add_output_column("result", default_value="DEFAULT")
+    table.add_row([cell], ["HIT"])
+
+    assert table.evaluate({"value": value}).outputs["result"] == "DEFAULT"
+
+
+def test_decision_table_slot_index_matches_scan():
+    """Literal/wildcard tables use the slot index with scan semantics"""
+    table = DecisionTable("shipping", hit_policy=HitPolicy.COLLECT)
+    table.add_input_column("tier", "tier")
+    table.add_input_column("region", "region")
+    table.add_output_column("fee", default_value=None)
+
+    table.add_row(["gold", "EU"], [0])
+    table.add_row(["gold", "*"], [5])
+    table.add_row(["*", "US"], [7])
+    table.add_row(["-", "*"], [9])
+
+    assert table.evaluate({"tier": "gold", "region": "EU"}).outputs["fee"] == [0, 5, 9]
+    assert table.evaluate({"tier": "gold", "region": "US"}).outputs["fee"] == [5, 7, 9]
+    assert table.evaluate({"tier": "basic", "region": "APAC"}).outputs["fee"] == [9]
+    assert table._slot_index is not None
+    # Literal cells are interned, so rows share one object per distinct text
+    table.add_row(["".join(["go", "ld"]), "".join(["E", "U"])], [1])
+    assert table.rows[-1].inputs[0] is table.rows[0].inputs[0]
+
+    # Rows added later are picked up
+    table.add_row(["basic", "APAC"], [3])
+    assert table.evaluate({"tier": "basic", "region": "APAC"}).outputs["fee"] == [9, 3]
+
+
+def test_decision_table_slot_index_fallbacks():
+    """Operator conditions and unhashable inputs fall back to the row scan"""
+    table = DecisionTable("mixed", hit_policy=HitPolicy.FIRST)
+    table.add_input_column("score", "score")
+    table.add_output_column("grade", default_value="none")
+    table.add_row([">= 90"], ["A"])
+    table.add_row([50], ["half"])
+
     assert table.evaluate({"score": 95}).outputs["grade"] == "A"
-    assert table.evaluate({"score": 85}).outputs["grade"] == "B"
-    assert table.evaluate({"score": 75}).outputs["grade"] == "C"
-    assert table.evaluate({"score": 65}).outputs["grade"] == "F"
+    assert table.evaluate({"score": 50}).outputs["grade"] == "half"
+    assert table._slot_index is None
+
+    literal = DecisionTable("literal", hit_policy=HitPolicy.FIRST)
+    literal.add_input_column("tags", "tags")
+    literal.add_output_column("kind", default_value="none")
+    literal.add_row(["x"], ["single"])
+
+    assert literal.evaluate({"tags": ["x"]}).outputs["kind"] == "none"
+    assert literal.evaluate({"tags": "x"}).outputs["kind"] == "single"
+
+
+def test_decision_table_threshold_index_matches_scan():
+    """Single-column numeric tables bisect sorted breakpoints with scan semantics"""
+    table = DecisionTable("bands", hit_policy=HitPolicy.COLLECT)
+    table.add_input_column("score", "score")
+    table.add_input_column("tier", "tier")
+    table.add_output_column("band", default_value=None)
+    table.add_row([">= 90", "*"], ["top"])
+    table.add_row(["70..90", "-"], ["mid"])
+    table.add_row(["< 70", None], ["low"])
+    table.add_row(["!= 80", "*"], ["not80"])
+    table.add_row(["*", "*"], ["any"])
+
+    def scan(score):
+        values = [score, None]
+        return [row.outputs[0] for row in table.rows
+                if table._row_matches(row, values, {}, None)]
+
+    numeric = [-1e308, 0, 69.999, 70, 75, 80, 89.5, 90, 90.0001, 1e308]
+    others = [True, 10 ** 400, "85", "abc", None, float("nan"), float("inf")]
+    expected = {repr(score): scan(score) or None for score in numeric + others}
+
+    table.evaluate({"score": 0})
+    assert table._threshold_index is not None
+
+    # Numeric inputs are answered by the index without scanning any row
+    scanned = []
+    row_matches = table._row_matches
+    table._row_matches = lambda row, *args: scanned.append(row) or row_matches(row, *args)
+    for score in numeric:
+        assert table.evaluate({"score": score}).outputs["band"] == expected[repr(score)]
+    assert scanned == []
+
+    for score in others:
+        assert table.evaluate({"score": score}).outputs["band"] == expected[repr(score)]
+    assert scanned
+    del table._row_matches
+
+    # Rows added later rebuild the index; a second constrained column disables it
+    table.add_row(["== 75", "gold"], ["gold75"])
+    assert table.evaluate({"score": 75, "tier": "gold"}).outputs["band"] == ["mid", "not80", "any", "gold75"]
+    assert table._threshold_index is None
+
+
+def test_decision_table_evaluate_batch():
+    """evaluate_batch returns the same results as per-record evaluate"""
+    table = DecisionTable("batch", hit_policy=HitPolicy.FIRST)
+    table.add_input_column("tier", "tier")
+    table.add_output_column("discount", default_value=0.0)
+    table.add_row(["gold"], [0.2])
+    table.add_row(["silver"], [0.1])
+
+    records = [{"tier": "gold"}, {"tier": "bronze"}, {"tier": "silver"}]
+    results = table.evaluate_batch(records)
+
+    assert [r.outputs["discount"] for r in results] == [0.2, 0.0, 0.1]
+    assert results == [table.evaluate(r) for r in records]
+    assert table.evaluate_batch([]) == []
+
+
+def test_decision_table_evaluate_batch_repeated_inputs():
+    """evaluate_batch on a scanned table matches per-record evaluate"""
+    table = DecisionTable("bands", hit_policy=HitPolicy.COLLECT)
+    table.add_input_column("age", "person.age")
+    table.add_output_column("band", default_value="none")
+    table.add_row(["< 18"], ["minor"])
+    table.add_row(["18..64"], ["adult"])
+    table.add_row([">= 60"], ["senior"])
+
+    records = [{"person": {"age": age}} for age in (10, 62, 10, 70, 62, None)]
+    records.append({"person": {"age": [1]}})
+    results = table.evaluate_batch(records)
+
+    assert results == [table.evaluate(r) for r in records]
+    assert results[1].outputs["band"] == ["adult", "senior"]
+    assert results[1] is not results[4]
 
 
 # ============================================================================
@@ -414,6 +855,23 @@ def test_constraint_checker_determinism():
     assert len(result3.violations) == 1
 
 
+def test_constraint_checker_determinism_cache_keys():
+    """Test determinism keys ignore key order and keep value types apart"""
+    checker = ConstraintChecker()
+    
+    assert checker.check_determinism({"x": 1, "y": 2}, 3, "f").passed
+    assert not checker.check_determinism({"y": 2, "x": 1}, 4, "f").passed
+    assert checker.check_determinism({"x": 1.0, "y": 2}, 4, "f").passed
+    assert checker.check_determinism({"x": 1, "y": 2}, 9, "g").passed
+    
+    nested = {"items": [1, 2], "meta": {"k": "v"}}
+    assert checker.check_determinism(nested, "ok", "h").passed
+    assert not checker.check_determinism(dict(nested), "changed", "h").passed
+    
+    _, digest = next(k for k in checker._execution_cache if k[0] == "h")
+    assert isinstance(digest, bytes) and len(digest) == 16
+
+
 def test_constraint_checker_performance():
     """Test performance constraint checking"""
     checker = ConstraintChecker()
@@ -456,6 +914,44 @@ def test_constraint_checker_severity_levels():
     assert len(result.warnings) == 1  # But has warning
 
 
+def test_constraint_checker_fail_fast():
+    """Test fail_fast stops at the first error but keeps earlier warnings"""
+    checker = ConstraintChecker()
+    checker.add_constraint("soft", ConstraintType.PRECONDITION, "x < 10", severity="warning")
+    checker.add_constraint("first", ConstraintType.PRECONDITION, "x < 50")
+    checker.add_constraint("second", ConstraintType.PRECONDITION, "x < 20")
+    
+    full = checker.validate_preconditions({"x": 100})
+    fast = checker.validate_preconditions({"x": 100}, fail_fast=True)
+    
+    assert [v.constraint_name for v in full.violations] == ["first", "second"]
+    assert [v.constraint_name for v in fast.violations] == ["first"]
+    assert len(fast.warnings) == 1
+    assert fast.passed == full.passed == False
+
+
+def test_constraint_checker_compiles_condition_once():
+    """Test constraints compile at add time and missing variables fail fast"""
+    checker = ConstraintChecker()
+    checker.add_constraint("range", ConstraintType.PRECONDITION, "lo <= x and x <= hi")
+    checker.add_constraint("broken", ConstraintType.INVARIANT, "x >")
+    checker.add_constraint("walrus", ConstraintType.INVARIANT, "(y := x) > 0")
+    
+    constraint = checker.get_constraint("range")
+    assert constraint.compiled is not None
+    assert constraint.required_names == {"lo", "x"}
+    assert checker.get_constraint("broken").compiled is None
+    
+    assert checker.validate_preconditions({"lo": 0, "x": 5, "hi": 10}).passed
+    assert not checker.validate_preconditions({"lo": 0, "x": 5}).passed
+    assert not checker.validate_invariants({"x": 1}).passed  # broken never holds
+    
+    context = {"x": 1}
+    checker.remove_constraint("broken")
+    assert checker.validate_invariants(context).passed
+    assert context == {"x": 1}  # walrus does not leak into the caller's context
+
+
 def test_constraint_checker_disabled():
     """Test disabled constraint checker"""
     checker = ConstraintChecker()
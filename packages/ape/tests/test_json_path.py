@@ -12,6 +12,10 @@ import pytest
 from ape.std import json
 
 
+# Read-only payload shared by the list-index cases (get/has_path never mutate)
+_ITEMS = {"items": [{"id": 1}, {"id": 2}]}
+
+
 class TestJsonGet:
     """Test json.get dotted path access."""
     
@@ -55,20 +59,13 @@ class TestJsonGet:
         result = json.get(data, "b.c")
         assert result is None
     
-    def test_array_index_access(self):
+    @pytest.mark.parametrize("path,expected", [
+        ("items.0.id", 1),
+        ("items.1.id", 2),
+    ])
+    def test_array_index_access(self, path, expected):
         """get can access list elements by index."""
-        data = {
-            "items": [
-                {"id": 1},
-                {"id": 2}
-            ]
-        }
-        
-        result = json.get(data, "items.0.id")
-        assert result == 1
-        
-        result = json.get(data, "items.1.id")
-        assert result == 2
+        assert json.get(_ITEMS, path) == expected
     
     def test_mixed_dict_list_access(self):
         """get handles mixed dict/list structures."""
@@ -81,6 +78,15 @@ class TestJsonGet:
         
         result = json.get(data, "users.0.tags.0")
         assert result == "admin"
+    
+    def test_numeric_segment_as_dict_key(self):
+        """Numeric segments stay string keys for dicts and indices for lists."""
+        data = {"2024": {"q": [10, 20]}}
+        
+        assert json.get(data, "2024.q.1") == 20
+        assert json.get(data, "2024.q.x", "bad") == "bad"
+        assert json.has_path(data, "2024.q.-1") is False
+        assert json.set({}, "rows.0", "x") == {"rows": []}
 
 
 class TestJsonHasPath:
@@ -107,12 +113,13 @@ class TestJsonHasPath:
         assert json.has_path(data, "a.b") is True
         assert json.has_path(data, "a.b.c") is False
     
-    def test_has_path_with_lists(self):
+    @pytest.mark.parametrize("path,expected", [
+        ("items.0.id", True),
+        ("items.5.id", False),
+    ])
+    def test_has_path_with_lists(self, path, expected):
         """has_path works with list indices."""
-        data = {"items": [{"id": 1}, {"id": 2}]}
-        
-        assert json.has_path(data, "items.0.id") is True
-        assert json.has_path(data, "items.5.id") is False
+        assert json.has_path(_ITEMS, path) is expected
 
 
 class TestJsonSet:
@@ -159,6 +166,21 @@ class TestJsonSet:
         
         assert result["items"] == [1, 20, 3]
         assert data["items"] == [1, 2, 3]  # Original unchanged
+    
+    def test_set_shares_untouched_subtrees(self):
+        """set copies only the path; sibling subtrees are shared."""
+        data = {
+            "config": {"db": {"host": "a"}, "cache": {"ttl": 60}},
+            "users": [{"id": 1}, {"id": 2}],
+        }
+        
+        result = json.set(data, "users.1.id", 20)
+        
+        assert result["users"] == [{"id": 1}, {"id": 20}]
+        assert data["users"][1] == {"id": 2}
+        assert result["users"] is not data["users"]
+        assert result["users"][0] is data["users"][0]
+        assert result["config"] is data["config"]
 
 
 class TestJsonFlatten:
@@ -211,6 +233,32 @@ class TestJsonFlatten:
         assert "items.0.id" in result
         assert "items.1.id" in result
         assert result["items.0.id"] == 1
+    
+    def test_flatten_preserves_order_and_list_leaves(self):
+        """flatten keeps depth-first key order; nested lists are leaf values."""
+        data = {"a": {"x": 1, "y": [{"z": 2}, [3, 4], 5]}, "b": 6}
+        
+        result = json.flatten(data, "root")
+        
+        assert list(result.items()) == [
+            ("root.a.x", 1),
+            ("root.a.y.0.z", 2),
+            ("root.a.y.1", [3, 4]),
+            ("root.a.y.2", 5),
+            ("root.b", 6),
+        ]
+    
+    def test_flatten_deep_nesting(self):
+        """flatten handles nesting deeper than the recursion limit."""
+        data = leaf = {}
+        for _ in range(5000):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+        leaf["v"] = 1
+        
+        result = json.flatten(data)
+        
+        assert result == {".".join(["n"] * 5000 + ["v"]): 1}
 
 
 class TestComplexScenarios:
@@ -303,6 +351,9 @@ class TestNegativeCases:
         
         result = json.get(data, "a.b", default="default")
         assert result == "default"
+        # A stored None is a value, not a missing key
+        assert json.get(data, "a", default="default") is None
+        assert json.has_path(data, "a") is True
     
     def test_invalid_list_index(self):
         """get handles invalid list indices gracefully."""
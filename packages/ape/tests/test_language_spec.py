@@ -5,12 +5,16 @@ This test scans all .ape example files in the repository and extracts step verbs
 to ensure they're documented in STEP_VERBS. It helps prevent spec drift.
 """
 
+import os
 import re
+from collections import Counter
+from itertools import chain
 from pathlib import Path
 from typing import Set
 
 import pytest
 
+from tests._helpers import ape_files_under, read_source
 from ape.language_spec import (
     STEP_VERBS,
     TOP_LEVEL_KEYWORDS,
@@ -42,6 +46,14 @@ APE_EXAMPLE_DIRS = [
     "ape_std",
 ]
 
+# A steps: header and the lines after it, up to the next unindented line
+# that is not blank or a comment
+STEPS_BLOCK_RE = re.compile(
+    r"^[^\S\n]*steps:[^\n]*(\n(?:(?:[^\S\n][^\n]*|#[^\n]*|)(?:\n|\Z))*)", re.M
+)
+# First word of a step bullet, taken as its verb
+STEP_BULLET_VERB_RE = re.compile(r"^[^\S\n]*-[^\S\n]*(\w+)", re.M)
+
 
 def find_ape_files() -> list[Path]:
     """Find all .ape files in known example directories."""
@@ -49,15 +61,13 @@ def find_ape_files() -> list[Path]:
     ape_files = []
     
     for example_dir in APE_EXAMPLE_DIRS:
-        dir_path = base_dir / example_dir
-        if dir_path.exists():
-            ape_files.extend(dir_path.glob("**/*.ape"))
+        ape_files.extend(map(Path, ape_files_under(os.path.join(base_dir, example_dir))))
     
     # Also check root-level demo files
     root_dir = base_dir.parent.parent
     ape_files.extend(root_dir.glob("demo_*.ape"))
     
-    return sorted(ape_files)
+    return ape_files
 
 
 def extract_step_verbs(ape_file: Path) -> Set[str]:
@@ -66,35 +76,14 @@ def extract_step_verbs(ape_file: Path) -> Set[str]:
     
     Returns set of lowercase step verbs found in the file.
     """
-    verbs = set()
-    content = ape_file.read_text(encoding="utf-8")
-    
-    # Find all steps: sections (after 'steps:' until next unindented line or EOF)
-    in_steps = False
-    for line in content.split("\n"):
-        stripped = line.lstrip()
-        
-        # Check if we're entering a steps section
-        if stripped.startswith("steps:"):
-            in_steps = True
-            continue
-        
-        # Check if we've left the steps section (unindented line that's not a comment/blank)
-        if in_steps and line and not line[0].isspace() and not line.strip().startswith("#"):
-            in_steps = False
-        
-        # Extract verb from step bullets
-        if in_steps and stripped.startswith("-"):
-            # Remove the bullet and leading whitespace
-            step_text = stripped[1:].lstrip()
-            
-            # Extract first word as potential verb
-            match = re.match(r"(\w+)", step_text)
-            if match:
-                verb = match.group(1).lower()
-                verbs.add(verb)
-    
-    return verbs
+    content = read_source(ape_file)
+    
+    # Find all steps: sections, then the bullets inside each one
+    return {
+        match.group(1).lower()
+        for block in STEPS_BLOCK_RE.finditer(content)
+        for match in STEP_BULLET_VERB_RE.finditer(block.group(1))
+    }
 
 
 class TestLanguageSpec:
@@ -105,12 +94,13 @@ class TestLanguageSpec:
         ape_files = find_ape_files()
         assert len(ape_files) > 0, "Should find at least one .ape file"
         
+        known_verbs = STEP_VERBS.words  # already a frozenset
         all_found_verbs = set()
         files_with_unknown_verbs = []
         
         for ape_file in ape_files:
             found_verbs = extract_step_verbs(ape_file)
-            unknown_verbs = found_verbs - STEP_VERBS.words
+            unknown_verbs = found_verbs - known_verbs
             
             if unknown_verbs:
                 files_with_unknown_verbs.append((ape_file, unknown_verbs))
@@ -119,29 +109,29 @@ class TestLanguageSpec:
         
         if files_with_unknown_verbs:
             error_msg = "Found step verbs not in STEP_VERBS:\n"
-            for file_path, verbs in files_with_unknown_verbs:
+            for file_path, verbs in sorted(files_with_unknown_verbs, key=lambda t: t[0].name):
                 error_msg += f"  {file_path.name}: {sorted(verbs)}\n"
             error_msg += "\nAdd missing verbs to STEP_VERBS in language_spec.py"
             pytest.fail(error_msg)
     
     def test_step_verbs_alphabetically_sorted(self):
         """STEP_VERBS should be alphabetically sorted for maintainability."""
-        verbs_list = sorted(list(STEP_VERBS.words))
-        # Just verify we can iterate - sets are unordered by nature
-        assert len(verbs_list) > 0, "STEP_VERBS should not be empty"
+        # Sets are unordered by nature; only check there is something to sort
+        assert STEP_VERBS.words, "STEP_VERBS should not be empty"
     
     def test_keyword_uniqueness(self):
         """Keyword sets should not overlap."""
-        all_keywords = (
-            TOP_LEVEL_KEYWORDS
-            | SECTION_KEYWORDS
-            | CONTROL_FLOW_KEYWORDS
-            | BOOLEAN_KEYWORDS
-        )
-        
-        # Check for any duplicates
-        keyword_list = list(all_keywords)
-        assert len(keyword_list) == len(set(keyword_list)), "Keywords should be unique across sets"
+        keyword_sets = [
+            TOP_LEVEL_KEYWORDS,
+            SECTION_KEYWORDS,
+            CONTROL_FLOW_KEYWORDS,
+            BOOLEAN_KEYWORDS,
+        ]
+        
+        # Count each keyword over all sets in one pass; a count above 1 is an overlap
+        counts = Counter(chain.from_iterable(keyword_sets))
+        duplicates = sorted(word for word, count in counts.items() if count > 1)
+        assert not duplicates, f"Keywords should be unique across sets: {duplicates}"
     
     def test_helper_functions(self):
         """Test helper functions work correctly."""
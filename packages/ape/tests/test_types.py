@@ -8,6 +8,8 @@ Tests verify runtime behavior of:
 - Value/Any type behavior
 - APE → Python serialization
 """
+import functools
+
 import pytest
 from ape.tokenizer.tokenizer import Tokenizer
 from ape.parser.parser import Parser
@@ -27,9 +29,15 @@ def parse_and_validate(ape_code: str):
     return ast
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_parse(ape_code: str):
+    """parse_and_validate, memoized by source; execution never mutates the AST."""
+    return parse_and_validate(ape_code)
+
+
 def execute_function(ape_code: str, fn_name: str):
     """Helper to execute APE code and call a function."""
-    ast = parse_and_validate(ape_code)
+    ast = _cached_parse(ape_code)
     executor = RuntimeExecutor()
     context = ExecutionContext()
     executor.execute(ast, context)
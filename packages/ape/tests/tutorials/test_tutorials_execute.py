@@ -2,22 +2,49 @@
 # Verifies all tutorial scenarios execute successfully
 
 from pathlib import Path
+import copy
+import functools
+import os
 import re
 import json
 import pytest
-from ape import run
+from ape import ExecutionContext, RuntimeExecutor
+from ape.lang import get_adapter
+from ape.parser.parser import Parser
+from ape.tokenizer.tokenizer import Tokenizer
+from tests._helpers import ape_files_under, read_source
 
 # Get tutorials directory
 TUTORIALS_DIR = Path(__file__).parent.parent.parent / "tutorials"
 
+EXPECT_RE = re.compile(r'#\s*EXPECT:\s*(.+)')
+
 def iter_tutorial_files():
     """Find all .ape files in tutorials directory."""
-    for ape_file in TUTORIALS_DIR.rglob("*.ape"):
-        yield ape_file
+    for ape_file in ape_files_under(str(TUTORIALS_DIR)):
+        yield Path(ape_file)
+
+@functools.lru_cache(maxsize=None)
+def _read_tutorial(path: str) -> str:
+    """Read a tutorial once; several tests load the same files."""
+    return read_source(path)
+
+def parse_tutorial(source: str, language: str = "en"):
+    """Normalize, tokenize and parse a tutorial the same way ape.run does."""
+    normalized_source = get_adapter(language).normalize_source(source)
+    return Parser(Tokenizer(normalized_source).tokenize()).parse()
 
+def run_ast(ast, context: dict):
+    """Execute a parsed tutorial against a fresh context, as ape.run does."""
+    exec_context = ExecutionContext()
+    for key, value in context.items():
+        exec_context.set(key, value)
+    return RuntimeExecutor().execute(ast, exec_context)
+
+@functools.lru_cache(maxsize=None)
 def extract_expected(source: str):
     """Parse EXPECT comment from APE source."""
-    match = re.search(r'#\s*EXPECT:\s*(.+)', source)
+    match = EXPECT_RE.search(source)
     if match:
         expected_str = match.group(1).strip()
         try:
@@ -31,6 +58,55 @@ def extract_expected(source: str):
 # Collect all tutorial files
 TUTORIAL_FILES = list(iter_tutorial_files())
 
+# First tutorial found per scenario directory, for the additional path cases
+SCENARIO_TUTORIALS = {path.parent.name: path for path in reversed(TUTORIAL_FILES)}
+# For multilanguage, use tutorial_en.ape
+SCENARIO_TUTORIALS["scenario_multilanguage_team"] = (
+    TUTORIALS_DIR / "scenario_multilanguage_team" / "tutorial_en.ape"
+)
+
+@pytest.fixture(scope="session")
+def prepared_tutorials():
+    """Parse every tutorial once per session; tests only execute the AST."""
+    return {
+        os.fspath(path): parse_tutorial(_read_tutorial(os.fspath(path)))
+        for path in TUTORIAL_FILES
+    }
+
+@pytest.fixture(scope="session")
+def run_tutorial(prepared_tutorials):
+    """Execute a prepared tutorial, reusing the result of an identical earlier run.
+
+    Execution is deterministic, so tests running the same tutorial with the
+    same inputs share one run. Callers get a copy of the cached result, and
+    contexts that cannot form a key are simply run uncached.
+    """
+    results = {}
+
+    def run(tutorial_path, context: dict):
+        path = os.fspath(tutorial_path)
+        try:
+            key = (path, frozenset(context.items()))
+            cached = key in results
+        except TypeError:
+            return run_ast(prepared_tutorials[path], context)
+        if not cached:
+            results[key] = run_ast(prepared_tutorials[path], context)
+        return copy.deepcopy(results[key])
+
+    return run
+
+@pytest.fixture(scope="session")
+def scenario_index():
+    """File names in each scenario directory, from one scandir per directory."""
+    index = {}
+    with os.scandir(TUTORIALS_DIR) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                with os.scandir(entry.path) as files:
+                    index[entry.path] = frozenset(f.name for f in files if f.is_file())
+    return index
+
 # Define context/inputs for each tutorial
 # Primary contexts test the happy path (matches EXPECT comments)
 SCENARIO_CONTEXTS = {
@@ -202,24 +278,22 @@ ADDITIONAL_TEST_CASES = [
 ]
 
 @pytest.mark.parametrize("tutorial_path", TUTORIAL_FILES, ids=lambda p: p.stem)
-def test_tutorial_executes_without_error(tutorial_path):
+def test_tutorial_executes_without_error(tutorial_path, run_tutorial):
     """Verify tutorial executes successfully."""
-    source = tutorial_path.read_text(encoding='utf-8')
-    
     # Get context based on parent directory (scenario name)
     scenario_name = tutorial_path.parent.name
     context = SCENARIO_CONTEXTS.get(scenario_name, {})
     
     # Execute the tutorial
-    result = run(source, context=context)
+    result = run_tutorial(tutorial_path, context)
     
     # Basic validation: execution completed without errors
     # Note: result can be None for tutorials without explicit returns
 
 @pytest.mark.parametrize("tutorial_path", TUTORIAL_FILES, ids=lambda p: p.stem)
-def test_tutorial_matches_expected(tutorial_path):
+def test_tutorial_matches_expected(tutorial_path, run_tutorial):
     """Verify tutorial result matches EXPECT comment."""
-    source = tutorial_path.read_text(encoding='utf-8')
+    source = _read_tutorial(os.fspath(tutorial_path))
     
     # Extract expected value
     expected = extract_expected(source)
@@ -232,7 +306,7 @@ def test_tutorial_matches_expected(tutorial_path):
     context = SCENARIO_CONTEXTS.get(scenario_name, {})
     
     # Execute the tutorial
-    result = run(source, context=context)
+    result = run_tutorial(tutorial_path, context)
     
     # Validate result matches expected
     assert result == expected, (
@@ -242,26 +316,18 @@ def test_tutorial_matches_expected(tutorial_path):
     )
 
 @pytest.mark.parametrize("test_case", ADDITIONAL_TEST_CASES, ids=lambda tc: f"{tc['scenario']}_{tc['name']}")
-def test_tutorial_additional_paths(test_case):
+def test_tutorial_additional_paths(test_case, run_tutorial):
     """Verify tutorials handle multiple execution paths correctly."""
     scenario = test_case["scenario"]
     context = test_case["context"]
     expected = test_case["expected"]
     
     # Find the tutorial file for this scenario
-    scenario_dir = TUTORIALS_DIR / scenario
-    ape_files = list(scenario_dir.glob("*.ape"))
-    
-    # For multilanguage, use tutorial_en.ape
-    if scenario == "scenario_multilanguage_team":
-        tutorial_path = scenario_dir / "tutorial_en.ape"
-    else:
-        assert len(ape_files) > 0, f"No tutorial found for {scenario}"
-        tutorial_path = ape_files[0]
+    tutorial_path = SCENARIO_TUTORIALS.get(scenario)
+    assert tutorial_path is not None, f"No tutorial found for {scenario}"
     
-    # Read and execute
-    source = tutorial_path.read_text(encoding='utf-8')
-    result = run(source, context=context)
+    # Execute the already-parsed tutorial
+    result = run_tutorial(tutorial_path, context)
     
     # Validate result
     assert result == expected, (
@@ -270,23 +336,13 @@ def test_tutorial_additional_paths(test_case):
         f"Expected: {expected}\n"
         f"Got: {result}"
     )
-    
-    # Execute the tutorial
-    result = run(source, context=context)
-    
-    # Validate result matches expected
-    assert result == expected, (
-        f"Tutorial {tutorial_path.name} failed validation:\n"
-        f"Expected: {expected}\n"
-        f"Got: {result}"
-    )
 
 def test_all_tutorials_have_expect_comments():
     """Verify all tutorials include EXPECT comments for self-verification."""
     missing = []
     
     for tutorial_path in TUTORIAL_FILES:
-        source = tutorial_path.read_text(encoding='utf-8')
+        source = _read_tutorial(os.fspath(tutorial_path))
         expected = extract_expected(source)
         
         if expected is None:
@@ -315,13 +371,12 @@ def test_tutorial_count():
         f"Files found: {[p.name for p in TUTORIAL_FILES]}"
     )
 
-def test_each_scenario_has_readme():
+def test_each_scenario_has_readme(scenario_index):
     """Verify each tutorial scenario includes a README.md."""
     missing_readme = []
     
     for tutorial_path in TUTORIAL_FILES:
-        readme_path = tutorial_path.parent / "README.md"
-        if not readme_path.exists():
+        if "README.md" not in scenario_index.get(os.fspath(tutorial_path.parent), ()):
             missing_readme.append(tutorial_path.parent.name)
     
     assert len(missing_readme) == 0, (
@@ -339,15 +394,13 @@ def test_each_scenario_has_readme():
     "scenario_ape_anthropic",
     "scenario_ape_langchain"
 ])
-def test_required_scenarios_exist(scenario):
+def test_required_scenarios_exist(scenario, scenario_index):
     """Verify all 8 required scenarios are present."""
-    scenario_dir = TUTORIALS_DIR / scenario
-    assert scenario_dir.exists(), f"Missing required scenario: {scenario}"
+    files = scenario_index.get(os.fspath(TUTORIALS_DIR / scenario))
+    assert files is not None, f"Missing required scenario: {scenario}"
     
     # Verify at least one .ape file exists
-    ape_files = list(scenario_dir.glob("*.ape"))
-    assert len(ape_files) > 0, f"Scenario {scenario} has no .ape files"
+    assert any(name.endswith(".ape") for name in files), f"Scenario {scenario} has no .ape files"
     
     # Verify README exists
-    readme_path = scenario_dir / "README.md"
-    assert readme_path.exists(), f"Scenario {scenario} missing README.md"
+    assert "README.md" in files, f"Scenario {scenario} missing README.md"
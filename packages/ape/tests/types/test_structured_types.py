@@ -11,6 +11,12 @@ import pytest
 from ape.types import ApeList, ApeMap, ApeRecord, ApeTuple
 
 
+@pytest.fixture(scope="module")
+def int_list():
+    """Shared ApeList([1, 2, 3]) for tests that only read it"""
+    return ApeList([1, 2, 3])
+
+
 class TestApeList:
     """Test cases for ApeList<T> type"""
     
@@ -30,27 +36,24 @@ class TestApeList:
         empty_list = ApeList()
         assert len(empty_list) == 0
     
-    def test_list_iteration(self):
+    def test_list_iteration(self, int_list):
         """Test iterating over list"""
-        int_list = ApeList([1, 2, 3])
         items = []
         for item in int_list:
             items.append(item)
         assert items == [1, 2, 3]
     
-    def test_list_membership(self):
+    def test_list_membership(self, int_list):
         """Test membership testing (in operator)"""
-        int_list = ApeList([1, 2, 3])
         assert 2 in int_list
         assert 5 not in int_list
     
-    def test_list_equality(self):
+    def test_list_equality(self, int_list):
         """Test value-based equality"""
-        list1 = ApeList([1, 2, 3])
         list2 = ApeList([1, 2, 3])
         list3 = ApeList([3, 2, 1])
-        assert list1 == list2
-        assert list1 != list3
+        assert int_list == list2
+        assert int_list != list3
     
     def test_list_concatenation(self):
         """Test list concatenation"""
@@ -60,18 +63,6 @@ class TestApeList:
         assert len(list3) == 4
         assert list3[0] == 1
         assert list3[3] == 4
-    
-    def test_list_bounds_checking(self):
-        """Test index out of bounds"""
-        int_list = ApeList([1, 2, 3])
-        with pytest.raises(IndexError):
-            _ = int_list[10]
-    
-    def test_list_invalid_index_type(self):
-        """Test that non-integer indices raise TypeError"""
-        int_list = ApeList([1, 2, 3])
-        with pytest.raises(TypeError):
-            _ = int_list["invalid"]
 
 
 @pytest.mark.skip(reason="v1.0.0 scaffold - Map<K,V> implementation pending")
@@ -176,15 +167,16 @@ class TestApeTuple:
         # Should be able to use in set/dict
         s = {tuple1, tuple2}
         assert len(s) == 1  # Same values, so only one in set
-    
-    def test_tuple_bounds_checking(self):
-        """Test index out of bounds"""
-        point = ApeTuple((10, 20))
-        with pytest.raises(IndexError):
-            _ = point[10]
-    
-    def test_tuple_invalid_index_type(self):
-        """Test that non-integer indices raise TypeError"""
-        point = ApeTuple((10, 20))
-        with pytest.raises(TypeError):
-            _ = point["invalid"]
+
+
+@pytest.mark.parametrize("factory,payload", [
+    (ApeList, [1, 2, 3]),
+    (ApeTuple, (10, 20)),
+], ids=["list", "tuple"])
+def test_sequence_index_errors(factory, payload):
+    """Out-of-range indices raise IndexError, non-integer indices TypeError"""
+    sequence = factory(payload)
+    with pytest.raises(IndexError):
+        _ = sequence[10]
+    with pytest.raises(TypeError):
+        _ = sequence["invalid"]
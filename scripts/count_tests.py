@@ -15,6 +15,7 @@ Output:
 import subprocess
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -66,10 +67,14 @@ def main():
         ("langchain", "tests/", repo_root / "packages" / "ape-langchain")
     ]
     
-    # Count tests
-    counts = {}
-    for name, test_path, working_dir in test_configs:
-        counts[name] = count_tests_in_path(test_path, cwd=str(working_dir))
+    # Count tests; each package is an independent pytest subprocess, so run
+    # them concurrently (threads only wait on the child processes)
+    with ThreadPoolExecutor(max_workers=len(test_configs)) as pool:
+        results = pool.map(
+            lambda config: count_tests_in_path(config[1], cwd=str(config[2])),
+            test_configs
+        )
+        counts = {name: count for (name, _, _), count in zip(test_configs, results)}
     
     # Calculate total
     counts["total"] = sum(counts.values())
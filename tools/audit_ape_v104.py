@@ -4,13 +4,16 @@ import argparse
 import os
 import subprocess
 import sys
-import textwrap
+from bisect import bisect_right
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
-IGNORED_DIRS = {
+IGNORED_DIRS = frozenset({
     ".git",
     ".svn",
     ".hg",
@@ -22,9 +25,9 @@ IGNORED_DIRS = {
     ".mypy_cache",
     ".pytest_cache",
     ".ruff_cache",
-}
+})
 
-TEXT_EXTENSIONS = {
+TEXT_EXTENSIONS = frozenset({
     ".py",
     ".ape",
     ".md",
@@ -38,7 +41,12 @@ TEXT_EXTENSIONS = {
     ".rst",
     ".csv",
     ".tsv",
-}
+})
+
+# Files larger than this are not searched (lockfiles, data dumps)
+MAX_SCAN_BYTES = 2 * 1024 * 1024
+# A NUL byte within this many leading bytes marks a file as binary
+BINARY_SNIFF_BYTES = 4096
 
 SEARCH_TERMS = [
     "record",
@@ -87,6 +95,20 @@ COMPONENT_PATTERNS = {
     "stdlib": ["ape_std", "stdlib", "std"],
 }
 
+
+def _invert_component_patterns() -> tuple[tuple[str, tuple[str, ...]], ...]:
+    # Each distinct keyword once, with every component it marks
+    # ("std" counts for both builtins and stdlib)
+    table: dict[str, list[str]] = defaultdict(list)
+    for component, keywords in COMPONENT_PATTERNS.items():
+        for keyword in keywords:
+            table[keyword].append(component)
+    return tuple((keyword, tuple(components)) for keyword, components in table.items())
+
+
+COMPONENT_KEYWORDS = _invert_component_patterns()
+
+
 IMPORTANT_SUBTREES = {
     ".": 1,
     "packages": 1,
@@ -115,16 +137,89 @@ def discover_root(script_path: Path) -> Path:
     return script_path.resolve().parents[1]
 
 
+def _walk(top: str) -> Iterator[tuple[str, list[os.DirEntry[str]]]]:
+    """
+    Top-down walk like os.walk, yielding each directory with its file entries.
+
+    Works off os.scandir so the type checks use the cached DirEntry data.
+    Ignored directories are pruned, symlinked directories are listed but not
+    entered, and unreadable directories are skipped, all as os.walk does.
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+    files: list[os.DirEntry[str]] = []
+    subdirs: list[str] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry)
+        elif entry.name not in IGNORED_DIRS and not entry.is_symlink():
+            subdirs.append(entry.path)
+    yield top, files
+    for subdir in subdirs:
+        yield from _walk(subdir)
+
+
+def _iter_text_entries(root: Path) -> Iterator[os.DirEntry[str]]:
+    if any(parent.name in IGNORED_DIRS for parent in root.parents):
+        return
+    for dirpath, files in _walk(str(root)):
+        for entry in files:
+            suffix = os.path.splitext(entry.name)[1]
+            if suffix == ".":
+                suffix = ""  # "name." has no suffix, as with Path.suffix
+            if suffix.lower() in TEXT_EXTENSIONS or not suffix:
+                yield entry
+        if dirpath == str(root) and root.name in IGNORED_DIRS:
+            # Everything below root sits under an ignored directory
+            return
+
+
 def iter_text_files(root: Path) -> Iterable[Path]:
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
-        current = Path(dirpath)
-        if any(parent.name in IGNORED_DIRS for parent in current.parents):
-            continue
-        for filename in filenames:
-            path = current / filename
-            if path.suffix.lower() in TEXT_EXTENSIONS or not path.suffix:
-                yield path
+    for entry in _iter_text_entries(root):
+        yield Path(entry.path)
+
+
+def read_scan_text(entry: os.DirEntry[str]) -> str | None:
+    """
+    Text of a file for the term scan, or None if it should be skipped.
+
+    Files over MAX_SCAN_BYTES and files with a NUL byte in the first
+    BINARY_SNIFF_BYTES are skipped, so generated dumps and binaries do not
+    dominate the scan. Non-UTF-8 files are decoded as latin-1.
+    """
+    try:
+        if entry.stat().st_size > MAX_SCAN_BYTES:
+            return None
+        with open(entry.path, "rb") as handle:
+            data = handle.read()
+    except OSError:
+        return None
+    if b"\x00" in data[:BINARY_SNIFF_BYTES]:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("latin-1")
+
+
+@lru_cache(maxsize=None)
+def _sorted_children(directory: Path) -> tuple[tuple[Path, bool], ...]:
+    """
+    Non-ignored children of a directory with their is_dir flag, dirs first.
+
+    IMPORTANT_SUBTREES nest inside each other, so the listings revisit the
+    same directories; each one is read, stat'ed and sorted only once.
+    """
+    entries = [(p, p.is_dir()) for p in directory.iterdir() if p.name not in IGNORED_DIRS]
+    entries.sort(key=lambda e: (not e[1], e[0].name.lower()))
+    return tuple(entries)
 
 
 def build_tree_listing(root: Path, target: Path, max_depth: int) -> list[str]:
@@ -136,14 +231,12 @@ def build_tree_listing(root: Path, target: Path, max_depth: int) -> list[str]:
     def walk(current: Path, depth: int) -> None:
         if depth > max_depth:
             return
-        entries = [p for p in current.iterdir() if p.name not in IGNORED_DIRS]
-        entries.sort(key=lambda p: (not p.is_dir(), p.name.lower()))
         indent = "  " * depth
-        for entry in entries:
-            marker = "/" if entry.is_dir() else ""
+        for entry, is_dir in _sorted_children(current):
+            marker = "/" if is_dir else ""
             rel = entry.relative_to(root)
             lines.append(f"{indent}- {rel}{marker}")
-            if entry.is_dir():
+            if is_dir:
                 walk(entry, depth + 1)
 
     header = f"[tree] {target} (depth {max_depth})"
@@ -155,46 +248,62 @@ def build_tree_listing(root: Path, target: Path, max_depth: int) -> list[str]:
 
 def detect_components(root: Path) -> dict[str, list[Path]]:
     hits: dict[str, list[Path]] = {k: [] for k in COMPONENT_PATTERNS}
-    for dirpath, dirnames, _ in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
-        current = Path(dirpath)
-        rel = current.relative_to(root)
-        rel_str = "/".join(rel.parts)
-        lower = rel_str.lower()
-        for component, keywords in COMPONENT_PATTERNS.items():
-            if any(keyword in lower for keyword in keywords):
+    root_str = str(root)
+    # _walk joins every path onto root_str, so the relative path is a slice
+    prefix_len = len(os.path.join(root_str, ""))
+    for dirpath, _ in _walk(root_str):
+        if dirpath == root_str:
+            continue  # root itself never matches: its relative path is empty
+        rel_str = dirpath[prefix_len:]
+        lower = rel_str.replace(os.sep, "/").lower()
+        matched: set[str] = set()
+        for keyword, components in COMPONENT_KEYWORDS:
+            if keyword in lower:
+                matched.update(components)
+        if matched:
+            rel = Path(rel_str)
+            for component in matched:
                 hits[component].append(rel)
     return hits
 
 
 def scan_terms(root: Path, max_hits: int) -> dict[str, list[SearchHit]]:
-    results: dict[str, list[SearchHit]] = defaultdict(list)
-    lowered_terms = [term.lower() for term in SEARCH_TERMS]
-    term_set = list(zip(SEARCH_TERMS, lowered_terms))
-
-    for path in iter_text_files(root):
-        try:
-            text = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            try:
-                text = path.read_text(encoding="latin-1")
-            except Exception:
-                continue
+    results: dict[str, list[SearchHit]] = {term: [] for term in SEARCH_TERMS}
+    # Terms still below max_hits; saturated terms drop out and are not
+    # searched again, and the scan ends once none are left
+    active = [(term, term.lower(), results[term]) for term in SEARCH_TERMS]
+
+    for entry in _iter_text_entries(root):
+        if not active:
+            break
+        text = read_scan_text(entry)
+        if text is None:
+            continue
+        path = Path(entry.path)
         lines = text.splitlines()
-        for idx, line in enumerate(lines, start=1):
-            lower_line = line.lower()
-            for original_term, lowered_term in term_set:
-                if lowered_term in lower_line:
-                    if len(results[original_term]) >= max_hits:
-                        continue
-                    results[original_term].append(
-                        SearchHit(
-                            term=original_term,
-                            path=path,
-                            line_no=idx,
-                            snippet=line.strip(),
-                        )
+        # Search the whole lowered file once per term instead of every line
+        # for every term; hits map back to lines through the line offsets.
+        # Lowering never adds or removes line breaks, so the lowered lines
+        # line up with the original ones.
+        lowered_text = text.lower()
+        starts = list(accumulate(map(len, lowered_text.splitlines(keepends=True)), initial=0))
+        for original_term, lowered_term, hits in active:
+            pos = lowered_text.find(lowered_term)
+            append = hits.append
+            while pos != -1 and len(hits) < max_hits:
+                idx = bisect_right(starts, pos)
+                line = lines[idx - 1]
+                append(
+                    SearchHit(
+                        term=original_term,
+                        path=path,
+                        line_no=idx,
+                        snippet=line.strip(),
                     )
+                )
+                # One hit per line: resume the search on the next line
+                pos = lowered_text.find(lowered_term, starts[idx])
+        active = [term for term in active if len(term[2]) < max_hits]
     return results
 
 
@@ -209,11 +318,23 @@ def run_cli_probe(command: list[str], env: dict[str, str], cwd: Path) -> tuple[i
     return proc.returncode, proc.stdout.strip(), proc.stderr.strip()
 
 
-def run_probes(root: Path, probe_dir: Path) -> list[str]:
-    logs: list[str] = []
+def _indent(text: str, prefix: str) -> str:
+    # textwrap.indent without its regex: prefix every non-blank line
+    return "".join(prefix + line if line.strip() else line for line in text.splitlines(True))
+
+
+def _probe_log(code: int, out: str, err: str) -> Iterator[str]:
+    yield f"  exit={code}"
+    if out:
+        yield _indent(out, "    OUT: ")
+    if err:
+        yield _indent(err, "    ERR: ")
+
+
+def run_probes(root: Path, probe_dir: Path) -> Iterator[str]:
     if not probe_dir.exists():
-        logs.append(f"(no probes found at {probe_dir})")
-        return logs
+        yield f"(no probes found at {probe_dir})"
+        return
 
     env = os.environ.copy()
     packages_path = root / "packages"
@@ -221,32 +342,26 @@ def run_probes(root: Path, probe_dir: Path) -> list[str]:
     env["PYTHONPATH"] = f"{packages_path}{os.pathsep}{existing}" if existing else str(packages_path)
 
     help_cmd = [sys.executable, "-m", "ape.cli", "parse", "--help"]
-    logs.append("[cli] python -m ape.cli parse --help")
+    yield "[cli] python -m ape.cli parse --help"
     code, out, err = run_cli_probe(help_cmd, env, root)
-    logs.append(f"  exit={code}")
-    if out:
-        logs.append(textwrap.indent(out, prefix="    OUT: "))
-    if err:
-        logs.append(textwrap.indent(err, prefix="    ERR: "))
+    yield from _probe_log(code, out, err)
     if code != 0:
-        logs.append("  CLI help failed; skipping probe execution.")
-        return logs
+        yield "  CLI help failed; skipping probe execution."
+        return
 
     ape_files = sorted(probe_dir.glob("*.ape"))
     if not ape_files:
-        logs.append(f"(probe dir {probe_dir} has no .ape files)")
-        return logs
+        yield f"(probe dir {probe_dir} has no .ape files)"
+        return
 
-    for ape_file in ape_files:
-        cmd = [sys.executable, "-m", "ape.cli", "validate", str(ape_file)]
-        logs.append(f"[probe] {' '.join(cmd)}")
-        code, out, err = run_cli_probe(cmd, env, root)
-        logs.append(f"  exit={code}")
-        if out:
-            logs.append(textwrap.indent(out, prefix="    OUT: "))
-        if err:
-            logs.append(textwrap.indent(err, prefix="    ERR: "))
-    return logs
+    # Each probe is an independent interpreter, so run them concurrently
+    # and report in file order
+    commands = [[sys.executable, "-m", "ape.cli", "validate", str(f)] for f in ape_files]
+    with ThreadPoolExecutor(max_workers=min(len(commands), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(run_cli_probe, cmd, env, root) for cmd in commands]
+        for cmd, future in zip(commands, futures):
+            yield f"[probe] {' '.join(cmd)}"
+            yield from _probe_log(*future.result())
 
 
 def build_argument_parser() -> argparse.ArgumentParser:
@@ -313,8 +428,7 @@ def main() -> int:
         print("")
 
     print("=== CLI / Probe Checks ===")
-    for line in run_probes(root, probe_dir):
-        print(line)
+    sys.stdout.write("".join(f"{line}\n" for line in run_probes(root, probe_dir)))
 
     return 0
 